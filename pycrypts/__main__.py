@@ -4,10 +4,12 @@ import sys
 
 from pycrypts.game import PyCrypts
 
-pycrypt = PyCrypts(pygame, logging, sys.argv)
-pycrypt.init()
+# Worker processes re-import this module, and mustn't start a game of their own.
+if __name__ == "__main__":
+    pycrypt = PyCrypts(pygame, logging, sys.argv)
+    pycrypt.init()
 
-while pycrypt.tick():
-    pass
+    while pycrypt.tick():
+        pass
 
-pycrypt.quit()
+    pycrypt.quit()
@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING
+
+import pygame
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+
+class Mixer:
+    volume = 0.125
+
+    def __init__(self, game: "PyCrypts"):
+        self.game = game
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+
+    def get_sound(self, key: str) -> pygame.mixer.Sound | None:
+        sound = self.sounds.get(key)
+
+        if sound is not None:
+            return sound
+
+        sound = self.game.pygame.mixer.Sound(key + ".mp3")
+        sound.set_volume(Mixer.volume)
+
+        self.sounds[key] = sound
+
+        return sound
+
+    def play(self, key: str):
+        self.game.pygame.mixer.Sound.play(self.get_sound(key))
@@ -0,0 +1,9 @@
+from .mixer import Mixer
+
+
+class NullMixer(Mixer):
+    def get_sound(self, key: str) -> None:
+        return None
+
+    def play(self, key: str):
+        pass
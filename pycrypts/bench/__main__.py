@@ -0,0 +1,36 @@
+import argparse
+import json
+import sys
+
+from pycrypts.bench.benchmark import Benchmark
+
+# Worker processes started with --room-workers re-import this module, and mustn't start benchmarks of their own.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m pycrypts.bench", description="Run headless stress scenarios and report their timings as JSON")
+    parser.add_argument("--monsters", type=int, nargs="+", default=[10, 20, 40, 80], help="Monster counts to run, one scenario each")
+    parser.add_argument("--walls", type=int, default=20, help="Pillars scattered around the room")
+    parser.add_argument("--traps", type=int, default=4, help="Saw traps sweeping the room")
+    parser.add_argument("--volley", type=int, default=6, help="Fireballs and arrows fired across the room per volley (0 disables)")
+    parser.add_argument("--volley-interval", type=int, default=30, help="Simulation steps between volleys")
+    parser.add_argument("--frames", type=int, default=600, help="Timed frames per scenario")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced pass that measures memory")
+    parser.add_argument("--output", type=str, default=None, metavar="PATH", help="Write the report here instead of to stdout")
+
+    # Anything else is passed through to the game, such as --seed 3.
+    parsed, arguments = parser.parse_known_args()
+
+    results = []
+
+    for monsters in parsed.monsters:
+        benchmark = Benchmark(monsters, parsed.walls, parsed.traps, parsed.volley, parsed.volley_interval, parsed.frames, arguments)
+        results.append(benchmark.run(not parsed.no_memory))
+
+        print(f"{monsters} monsters: {results[-1]['ticks_per_second']:.1f} ticks/s", file=sys.stderr)
+
+    report = json.dumps({"arguments": arguments, "results": results}, indent=2)
+
+    if parsed.output:
+        with open(parsed.output, "w") as file:
+            file.write(report)
+    else:
+        print(report)
@@ -0,0 +1,136 @@
+import sys
+import time
+import tracemalloc
+import logging
+
+import pygame
+from pygame import Vector2
+
+from ..game import PyCrypts
+from ..rooms.stress_room import StressRoom
+from ..tickable.renderable.collidable.entities.projectiles.arrow import Arrow
+from ..tickable.renderable.collidable.entities.projectiles.fireball import Fireball
+
+
+class Benchmark:
+    # Steps run before timing starts, so the first path searches and asset loads aren't counted.
+    warmup = 60
+
+    def __init__(self, monsters: int, walls: int, traps: int, volley: int, volley_interval: int, frames: int, arguments: list[str]):
+        self.monsters = monsters
+        self.walls = walls
+        self.traps = traps
+        self.volley = volley
+        self.volley_interval = volley_interval
+        self.frames = frames
+        self.arguments = arguments
+
+    def create_game(self) -> tuple[PyCrypts, StressRoom]:
+        game = PyCrypts(pygame, logging, ["--headless", "--deterministic", "-l", "ERROR", *self.arguments])
+        game.init()
+
+        room = StressRoom(game, self.monsters, self.walls, self.traps)
+
+        for index, player in enumerate(game.players):
+            player.teleport(room.spawn_1 if index == 0 else room.spawn_2)
+            player.set_scale(room.entity_scale)
+            player.room = room
+
+        room.load()
+
+        return game, room
+
+    def step(self, game: PyCrypts, room: StressRoom) -> float:
+        # Players are kept alive so the monsters chase them for the whole run.
+        for player in game.players:
+            player.health = player.max_health
+
+        if self.volley and game.frame % self.volley_interval == 0:
+            self.fire(game, room)
+
+        start = time.perf_counter()
+        game.tick()
+
+        return time.perf_counter() - start
+
+    def fire(self, game: PyCrypts, room: StressRoom):
+        # Fireballs cross the room from the left and arrows from the right, in rows spread down its height.
+        for shot in range(self.volley):
+            y = StressRoom.border + (shot + 0.5) * (game.height - 2 * StressRoom.border) / self.volley
+            left = Vector2(StressRoom.border + 10, y)
+            right = Vector2(game.width - StressRoom.border - 40, y)
+
+            Fireball.spawn(right, left, 32, game, room, 1.2)
+            Arrow.spawn(left, right, 32, game, room)
+
+    def run(self, trace_memory: bool = True) -> dict:
+        game, room = self.create_game()
+
+        for _ in range(self.warmup):
+            self.step(game, room)
+
+        times = []
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+
+        for _ in range(self.frames):
+            times.append(self.step(game, room))
+
+        elapsed = time.perf_counter() - start
+        blocks = sys.getallocatedblocks() - blocks
+
+        times.sort()
+
+        result = {
+            "monsters": self.monsters,
+            "walls": self.walls,
+            "traps": self.traps,
+            "volley": self.volley,
+            "frames": self.frames,
+            "entities": len(room.get_collidables()),
+            "ticks_per_second": self.frames / elapsed,
+            "frame_time_p50_ms": times[len(times) // 2] * 1000,
+            "frame_time_p99_ms": times[min(len(times) - 1, len(times) * 99 // 100)] * 1000,
+            "frame_time_max_ms": times[-1] * 1000,
+            "allocated_blocks_delta": blocks,
+            "state_hash": game.get_state_hash()
+        }
+
+        game.quit()
+
+        if trace_memory:
+            result.update(self.measure_memory())
+
+        return result
+
+    def measure_memory(self) -> dict:
+        # Tracing slows everything down, so it runs as a second pass of the same seeded scenario rather than
+        # skewing the timings above.
+        game, room = self.create_game()
+
+        for _ in range(self.warmup):
+            self.step(game, room)
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+
+        for _ in range(self.frames):
+            self.step(game, room)
+
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        statistics = after.compare_to(before, "filename")
+
+        game.quit()
+
+        return {
+            "peak_traced_bytes": peak,
+            "retained_bytes": sum(statistic.size_diff for statistic in statistics),
+            "retained_blocks": sum(statistic.count_diff for statistic in statistics),
+            "top_retainers": [
+                {"file": statistic.traceback[0].filename, "bytes": statistic.size_diff}
+                for statistic in statistics[:5] if statistic.size_diff > 0
+            ]
+        }
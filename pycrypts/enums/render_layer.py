@@ -0,0 +1,8 @@
+from enum import IntEnum
+
+
+class RenderLayer(IntEnum):
+    WALLS = 0
+    ENTITIES = 1
+    PROJECTILES = 2
+    HUD = 3
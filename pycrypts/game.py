@@ -1,25 +1,49 @@
 import argparse
+import hashlib
 import os
+import struct
 import time
 import logging
 
 import pygame
-from pygame import Vector2, Surface
-
+from pygame import Vector2, Surface, Rect
+
+from .audio.mixer import Mixer
+from .audio.null_mixer import NullMixer
+from .input.input_recording import InputRecording
+from .input.input_source import InputSource
+from .input.keyboard_input import KeyboardInput
+from .input.recording_input import RecordingInput
+from .input.replay_input import ReplayInput
+from .input.scripted_input import ScriptedInput
+from .navigation.pathfinder import Pathfinder
+from .profiling.frame_profiler import FrameProfiler
+from .rendering.asset_loader import AssetLoader
+from .rendering.renderer import Renderer
+from .rendering.text_cache import TextCache
+from .rendering.transform_cache import TransformCache
 from .rooms.entrance_zone import EntranceZone
 from .rooms.room import Room
+from .rooms.room_workers import RoomWorkers
 from .rooms.surface_zone import SurfaceZone
+from .simulation.random_streams import RandomStreams
 from .tickable.renderable.collidable.collidable import Collidable
 from .tickable.renderable.collidable.entities.entity import Entity
+from .tickable.renderable.collidable.entities.entity_pool import EntityPool
 from .tickable.renderable.collidable.entities.living.living_entity import LivingEntity
 from .tickable.renderable.collidable.entities.living.players.player import Player
 from .tickable.renderable.collidable.walls.wall import Wall
 from .tickable.renderable.display.health_bar import HealthBar
+from .tickable.renderable.display.profiler_overlay import ProfilerOverlay
 from .tickable.renderable.renderable import Renderable
-from .tickable.tickable import Tickable
+from .tickable.tickable_container import TickableContainer
+from .tickable.tickable_registry import TickableRegistry
 
 
 class PyCrypts:
+    # Longest real frame the simulation will try to catch up on, so a hitch can't snowball into more steps.
+    max_frame_time = 0.25
+
     def __init__(self, game: pygame, log: logging, arguments: list[str] = None):
         if arguments is None:
             arguments = []
@@ -29,8 +53,24 @@ class PyCrypts:
 
         parser = argparse.ArgumentParser()
         parser.add_argument("-l", "--log-level", type=str, choices=[level for level in logging._nameToLevel.keys()], default="INFO", help="Set logging level")
+        parser.add_argument("--headless", action="store_true", help="Run without a display, audio or keyboard input")
+        parser.add_argument("--frames", type=int, default=0, help="Stop after this many simulation steps (0 runs until quit)")
+        parser.add_argument("--tick-rate", type=int, default=60, help="Simulation steps per second")
+        parser.add_argument("--frame-rate", type=int, default=0, help="Maximum rendered frames per second (0 is uncapped)")
+        parser.add_argument("--full-redraw", action="store_true", help="Redraw and flip the whole screen every frame")
+        parser.add_argument("--background-rate", type=int, default=0, help="Simulate entities in other rooms every this many steps (0 leaves them frozen)")
+        parser.add_argument("--room-workers", type=int, default=0, help="Simulate monsters in other rooms on this many worker processes (0 disables)")
+        parser.add_argument("--seed", type=int, default=None, help="Seed for every random stream (random by default)")
+        parser.add_argument("--deterministic", action="store_true", help="Step the simulation by a fixed amount per frame instead of by wall-clock time, seeding with 0 unless --seed is given")
+        parser.add_argument("--record", type=str, default=None, metavar="PATH", help="Save every simulation step's input, with the seed and tick rate, to this file on quit")
+        parser.add_argument("--replay", type=str, default=None, metavar="PATH", help="Replay a recording deterministically, with its seed and tick rate, quitting when it ends")
+        parser.add_argument("--profile", action="store_true", help="Start with the frame profiler running (F3 toggles it)")
+        parser.add_argument("--profile-trace", type=str, default=None, metavar="PATH", help="Save profiled frames as Chrome trace events to this file when profiling stops")
 
         parsed = parser.parse_args(arguments)
+
+        if parsed.record and parsed.replay:
+            parser.error("--record and --replay can't be used together")
         log_level = getattr(logging, parsed.log_level, logging.INFO)
         log.basicConfig(level=log_level)
 
@@ -38,22 +78,79 @@ class PyCrypts:
 
         self.pygame: pygame = game
 
+        self.headless: bool = parsed.headless
+        self.max_frames: int = parsed.frames
+        self.background_rate: int = parsed.background_rate
+        self.room_workers: RoomWorkers | None = RoomWorkers(self, parsed.room_workers) if parsed.room_workers else None
+
         self.screen: Surface | None = None
 
-        self.past = time.time()
-        self.dt = 0
+        self.mixer: Mixer = NullMixer(self) if self.headless else Mixer(self)
+        self.keys = None
+
+        self.frame = 0
+
+        seed = parsed.seed
+        tick_rate = parsed.tick_rate
+        recording = InputRecording.load(parsed.replay) if parsed.replay else None
+
+        if recording is not None:
+            seed = recording.seed
+            tick_rate = recording.tick_rate
+
+            # Stop where the recording does.
+            self.max_frames = min(self.max_frames, len(recording)) if self.max_frames else len(recording)
+
+        # Replays are always stepped by a fixed amount, so they play out the same however fast they run.
+        self.deterministic: bool = parsed.deterministic or recording is not None
+        self.random_streams = RandomStreams(0 if seed is None and self.deterministic else seed)
+
+        self.tick_rate: int = tick_rate
+        self.frame_rate: int = parsed.frame_rate
+        self.clock = self.pygame.time.Clock()
 
-        self.tickables: list[Tickable] = []
+        self.past = time.perf_counter()
+        self.dt = 1 / self.tick_rate
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+        if recording is not None:
+            self.input: InputSource = ReplayInput(self, recording)
+        else:
+            self.input = ScriptedInput(self) if self.headless else KeyboardInput(self)
+
+        if parsed.record:
+            self.input = RecordingInput(self, self.input, parsed.record)
+
+        self.renderer = Renderer(self)
+        self.full_redraw: bool = parsed.full_redraw
+        self.dirty_rects: list[Rect] = []
+        self.rendered_background: Surface | None = None
+
+        self.tickables = TickableContainer()
+        self.registry = TickableRegistry()
+        self.entity_pool = EntityPool(self)
+        self.pathfinder = Pathfinder(self)
         self.players: list[Player] = []
 
+        self.rooms: list[Room] = []
         self.current_room: Room | None = None
         self.entrance_zone: Room | None = None
         self.surface_zone: Room | None = None
 
         self.over = False
 
+        # Only exists while profiling, so an unprofiled frame pays for nothing but the checks.
+        self.profiler: FrameProfiler | None = None
+        self.profiler_overlay: ProfilerOverlay | None = None
+        self.profile: bool = parsed.profile or parsed.profile_trace is not None
+        self.profile_trace: str | None = parsed.profile_trace
+        self.profiler_key_held = False
+
         self.assets: dict[str, Surface] = {}
-        self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self.asset_loader = AssetLoader(self)
+        self.transforms = TransformCache(self)
+        self.text_cache = TextCache(self)
 
         self.height = None
         self.width = None
@@ -66,15 +163,27 @@ class PyCrypts:
     def init(self):
         os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
+        if self.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
         self.logger.info("Initialising PyGame")
         self.pygame.init()
 
-        self.logger.info("Creating screen")
-        self.screen = self.pygame.display.set_mode((1280, 720))
+        if self.headless:
+            self.logger.info("Creating headless screen")
+            self.screen = Surface((1280, 720))
+        else:
+            self.logger.info("Creating screen")
+            self.screen = self.pygame.display.set_mode((1280, 720))
+
+            self.pygame.display.set_caption(type(self).__name__)
 
-        self.pygame.display.set_caption(type(self).__name__)
+            self.pygame.display.set_icon(self.get_asset(f"assets/images/icons/{type(self).__name__.lower()}"))
 
-        self.pygame.display.set_icon(self.get_asset(f"assets/images/icons/{type(self).__name__.lower()}"))
+        # The game over screen's fonts are loaded up front, so the step the game ends on doesn't stall on them.
+        self.text_cache.get_font(None, 150)
+        self.text_cache.get_font(None, 50)
 
         self.height = self.screen.get_height()
         self.width = self.screen.get_width()
@@ -101,99 +210,255 @@ class PyCrypts:
         for player in players:
             i += 1
             if i == 1:
-                player.position = self.current_room.spawn_1
+                player.teleport(self.current_room.spawn_1)
             else:
-                player.position = self.current_room.spawn_2
+                player.teleport(self.current_room.spawn_2)
             player.set_scale(self.current_room.entity_scale)
 
+        if self.profile:
+            self.start_profiler()
+
+    def start_profiler(self):
+        self.logger.info("Starting frame profiler")
+
+        self.profiler = FrameProfiler(self, self.profile_trace)
+        self.profiler.start()
+
+        if not self.headless:
+            self.profiler_overlay = ProfilerOverlay(self.profiler, (10, 10), self)
+
+    def stop_profiler(self):
+        self.logger.info("Stopping frame profiler")
+
+        if self.profiler_overlay is not None:
+            self.profiler_overlay.unload()
+            self.profiler_overlay = None
+
+        self.profiler.stop()
+        self.profiler = None
+
+    def toggle_profiler(self):
+        # Toggled on the step the key goes down, rather than every step it's held.
+        held = self.keys is not None and self.keys[self.pygame.K_F3]
+
+        if held and not self.profiler_key_held:
+            if self.profiler is None:
+                self.start_profiler()
+            else:
+                self.stop_profiler()
+
+        self.profiler_key_held = held
+
     def tick(self):
-        if not self.over:
-            present = time.time()
-            self.dt = present - self.past
+        # Headless and deterministic runs advance by exactly one step, so the steps taken never depend on how long a
+        # frame took, and headless ones can run thousands of steps per second. The step is added as is rather than
+        # as a difference of clock readings, whose rounding depends on how long the machine has been up.
+        if self.headless or self.deterministic:
+            elapsed = self.dt
+        else:
+            present = time.perf_counter()
+            elapsed = present - self.past
             self.past = present
 
-        keys = self.pygame.key.get_pressed()
+        self.accumulator += min(elapsed, PyCrypts.max_frame_time)
+
+        self.toggle_profiler()
+        profiler = self.profiler
 
-        if keys[self.pygame.K_ESCAPE]:
+        if profiler is not None:
+            profiler.begin_frame()
+            profiler.begin("input")
+
+        if self.input.is_quit_requested():
             return False
 
-        for event in self.pygame.event.get():
-            if event.type == self.pygame.QUIT:
+        if profiler is not None:
+            profiler.end()
+
+        while self.accumulator >= self.dt:
+            self.accumulator -= self.dt
+
+            if not self.update():
                 return False
 
-        self.screen.fill((0, 0, 0))
+        self.alpha = self.accumulator / self.dt
 
-        if self.over:
-            font_1 = self.pygame.font.Font(None, 150)
+        if profiler is not None:
+            profiler.begin("render")
+
+        rects = self.render()
+
+        if profiler is not None:
+            profiler.end()
+
+        if not self.headless:
+            if profiler is not None:
+                profiler.begin("flip")
+
+            if rects is None:
+                self.pygame.display.flip()
+            else:
+                self.pygame.display.update(rects)
+
+            if profiler is not None:
+                profiler.end()
+
+        if profiler is not None:
+            profiler.end_frame()
+
+        if not self.headless:
+            if self.frame_rate:
+                self.clock.tick(self.frame_rate)
+
+        return True
 
-            text_1 = font_1.render("Game Over!", True, (255, 0, 0))
-            text_1_rect = text_1.get_rect(center=self.center)
+    def update(self) -> bool:
+        if self.max_frames and self.frame >= self.max_frames:
+            return False
 
-            self.screen.blit(text_1, text_1_rect)
+        profiler = self.profiler
 
-            font_2 = self.pygame.font.Font(None, 50)
+        if profiler is not None:
+            profiler.begin("input")
 
-            text_2 = font_2.render("Press ESC to exit", True, (200, 0, 0))
-            text_2_rect = text_2.get_rect(center=(self.center.x, self.center.y + 100))
+        self.keys = self.input.poll(self.frame)
+        self.frame += 1
 
-            self.screen.blit(text_2, text_2_rect)
+        if profiler is not None:
+            profiler.end()
 
-        if not self.over:
-            for tickable in self.tickables:
-                if isinstance(tickable, Collidable):
-                    if tickable.room != self.current_room:
-                        continue
+        if self.keys[self.pygame.K_ESCAPE]:
+            return False
+
+        if self.over:
+            return True
 
+        # Worker processes take over other rooms when enabled, so they aren't also ticked here.
+        background = self.room_workers is None and self.background_rate and self.frame % self.background_rate == 0
+
+        for tickable in self.tickables:
+            if isinstance(tickable, Collidable):
+                if tickable.room != self.current_room:
+                    # Entities in other rooms can be kept going in coarse steps, every so often.
+                    if background and isinstance(tickable, Entity):
+                        tickable.step_scale = self.background_rate
+                        tickable.tick()
+                        tickable.step_scale = 1
+
+                    continue
+
+            if profiler is None:
+                tickable.tick()
+            else:
+                # Each class gets its own section, named after it.
+                profiler.begin(type(tickable).__name__)
                 tickable.tick()
+                profiler.end()
+
+        if self.room_workers is not None and self.current_room is not None:
+            self.room_workers.update()
 
-        self.pygame.display.flip()
         return True
 
-    def get_asset(self, key: str) -> Surface:
-        asset = self.assets.get(key)
+    def render(self) -> list[Rect] | None:
+        if self.over:
+            self.render_game_over()
+            self.rendered_background = None
+            return None
+
+        background = self.current_room.get_background()
 
-        if asset is not None:
-            return asset
+        # Room changes and wall changes bring a new background, which needs a full repaint.
+        full = self.full_redraw or background is not self.rendered_background
+        self.rendered_background = background
 
-        try:
-            asset = self.pygame.image.load(key + ".png").convert_alpha()
-        except FileNotFoundError:
-            asset = self.pygame.image.load(key + ".svg").convert_alpha()
+        if full:
+            self.screen.blit(background, (0, 0))
+        else:
+            for rect in self.dirty_rects:
+                self.screen.blit(background, rect, rect)
 
-        self.assets[key] = asset
+        for renderable in self.get_renderables():
+            if renderable.static:
+                continue
 
-        return asset
+            if isinstance(renderable, Collidable):
+                if renderable.room != self.current_room:
+                    continue
 
-    def get_sound(self, key: str) -> pygame.mixer.Sound:
-        sound = self.sounds.get(key)
+            renderable.render()
 
-        if sound is not None:
-            return sound
+        rects = self.renderer.flush(self.screen)
 
-        sound = pygame.mixer.Sound(key + ".mp3")
-        sound.set_volume(0.125)
+        previous = self.dirty_rects
+        self.dirty_rects = rects
 
-        self.sounds[key] = sound
+        if full:
+            return None
 
-        return sound
+        return previous + rects
 
-    def get_renderables(self):
-        return list(filter(lambda tickable: isinstance(tickable, Renderable), self.tickables))
+    def render_game_over(self):
+        self.screen.fill((0, 0, 0))
+
+        text_1 = self.text_cache.render("Game Over!", None, 150, (255, 0, 0))
+        text_1_rect = text_1.get_rect(center=self.center)
+
+        self.screen.blit(text_1, text_1_rect)
+
+        text_2 = self.text_cache.render("Press ESC to exit", None, 50, (200, 0, 0))
+        text_2_rect = text_2.get_rect(center=(self.center.x, self.center.y + 100))
+
+        self.screen.blit(text_2, text_2_rect)
+
+    def get_asset(self, key: str) -> Surface:
+        return self.asset_loader.get(key)
+
+    def get_sound(self, key: str) -> pygame.mixer.Sound | None:
+        return self.mixer.get_sound(key)
+
+    def play_sound(self, key: str):
+        self.mixer.play(key)
+
+    def get_state_hash(self) -> str:
+        # Digest of everything the simulation carries from step to step, for comparing runs frame for frame.
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(struct.pack("<q?", self.frame, self.over))
 
-    def get_collidables(self):
-        return list(filter(lambda tickable: isinstance(tickable, Collidable), self.get_renderables()))
+        for tickable in self.tickables:
+            # Only what's in the rooms, so the HUD and profiler overlay coming and going doesn't change it.
+            if not isinstance(tickable, Collidable):
+                continue
 
-    def get_entities(self):
-        return list(filter(lambda tickable: isinstance(tickable, Entity), self.get_collidables()))
+            digest.update(type(tickable).__name__.encode())
 
-    def get_living_entities(self):
-        return list(filter(lambda tickable: isinstance(tickable, LivingEntity), self.get_entities()))
+            if isinstance(tickable, Entity):
+                position = tickable.position
+                velocity = tickable.velocity
+                digest.update(struct.pack("<dddd", position.x, position.y, velocity.x, velocity.y))
 
-    def get_players(self):
-        return list(filter(lambda tickable: isinstance(tickable, Player), self.get_living_entities()))
+            if isinstance(tickable, LivingEntity):
+                digest.update(struct.pack("<d", tickable.health))
 
-    def get_walls(self):
-        return list(filter(lambda tickable: isinstance(tickable, Wall), self.get_collidables()))
+        return digest.hexdigest()
+
+    def get_renderables(self) -> tuple[Renderable, ...]:
+        return self.registry.get(Renderable)
+
+    def get_collidables(self) -> tuple[Collidable, ...]:
+        return self.registry.get(Collidable)
+
+    def get_entities(self) -> tuple[Entity, ...]:
+        return self.registry.get(Entity)
+
+    def get_living_entities(self) -> tuple[LivingEntity, ...]:
+        return self.registry.get(LivingEntity)
+
+    def get_players(self) -> tuple[Player, ...]:
+        return self.registry.get(Player)
+
+    def get_walls(self) -> tuple[Wall, ...]:
+        return self.registry.get(Wall)
 
     def end(self):
         self.logger.info("Game over!")
@@ -201,4 +466,13 @@ class PyCrypts:
         self.current_room = None
 
     def quit(self):
+        self.input.close()
+        self.asset_loader.close()
+
+        if self.profiler is not None:
+            self.stop_profiler()
+
+        if self.room_workers is not None:
+            self.room_workers.close()
+
         self.pygame.quit()
@@ -0,0 +1,83 @@
+import struct
+from array import array
+from typing import Sequence
+
+
+class InputRecording:
+    magic = b"PCIR"
+    version = 1
+
+    # Magic, version, tick rate, seed and the number of tracked keys, followed by each key's code.
+    header = struct.Struct("<4sBHQB")
+    key = struct.Struct("<I")
+
+    # Steps are stored as runs of identical key masks: run length, then the mask.
+    run = struct.Struct("<II")
+
+    def __init__(self, tick_rate: int, seed: int, keys: Sequence[int], masks: array | None = None):
+        self.tick_rate = tick_rate
+        self.seed = seed
+        self.keys = tuple(keys)
+
+        # One bit per tracked key, one mask per simulation step.
+        self.masks = array("I") if masks is None else masks
+
+    def __len__(self):
+        return len(self.masks)
+
+    def get_mask(self, keys: Sequence[bool]) -> int:
+        mask = 0
+
+        for bit, key in enumerate(self.keys):
+            if keys[key]:
+                mask |= 1 << bit
+
+        return mask
+
+    def get_pressed(self, mask: int) -> list[int]:
+        return [key for bit, key in enumerate(self.keys) if mask >> bit & 1]
+
+    def save(self, path: str):
+        data = bytearray(self.header.pack(self.magic, self.version, self.tick_rate, self.seed, len(self.keys)))
+
+        for key in self.keys:
+            data += self.key.pack(key)
+
+        masks = self.masks
+        start = 0
+
+        while start < len(masks):
+            end = start + 1
+
+            while end < len(masks) and masks[end] == masks[start]:
+                end += 1
+
+            data += self.run.pack(end - start, masks[start])
+            start = end
+
+        with open(path, "wb") as file:
+            file.write(data)
+
+    @classmethod
+    def load(cls, path: str) -> "InputRecording":
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, tick_rate, seed, key_count = cls.header.unpack_from(data)
+
+        if magic != cls.magic or version != cls.version:
+            raise ValueError(f"{path} is not a version {cls.version} input recording")
+
+        offset = cls.header.size
+        keys = []
+
+        for _ in range(key_count):
+            keys.append(cls.key.unpack_from(data, offset)[0])
+            offset += cls.key.size
+
+        masks = array("I")
+
+        for length, mask in cls.run.iter_unpack(data[offset:]):
+            masks.extend([mask] * length)
+
+        return cls(tick_rate, seed, keys, masks)
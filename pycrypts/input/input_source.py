@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+
+class InputSource:
+    def __init__(self, game: "PyCrypts"):
+        self.game = game
+
+    def poll(self, frame: int) -> Sequence[bool]:
+        pass
+
+    def is_quit_requested(self) -> bool:
+        return False
+
+    def close(self):
+        pass
@@ -0,0 +1,15 @@
+from typing import Iterable
+
+
+class KeyState:
+    def __init__(self, pressed: Iterable[int] = ()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, KeyState) and self.pressed == other.pressed
+
+    def __hash__(self):
+        return hash(self.pressed)
@@ -0,0 +1,15 @@
+from typing import Sequence
+
+from .input_source import InputSource
+
+
+class KeyboardInput(InputSource):
+    def poll(self, frame: int) -> Sequence[bool]:
+        return self.game.pygame.key.get_pressed()
+
+    def is_quit_requested(self) -> bool:
+        for event in self.game.pygame.event.get():
+            if event.type == self.game.pygame.QUIT:
+                return True
+
+        return False
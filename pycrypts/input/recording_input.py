@@ -0,0 +1,39 @@
+from typing import TYPE_CHECKING, Sequence
+
+from .input_recording import InputRecording
+from .input_source import InputSource
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+
+class RecordingInput(InputSource):
+    def __init__(self, game: "PyCrypts", source: InputSource, path: str):
+        super().__init__(game)
+
+        self.source = source
+        self.path = path
+
+        pygame = game.pygame
+
+        # Every key the game reads. Anything else pressed during the session isn't kept.
+        keys = (
+            pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+            pygame.K_UP, pygame.K_LEFT, pygame.K_DOWN, pygame.K_RIGHT,
+            pygame.K_LSHIFT, pygame.K_RSHIFT, pygame.K_LALT, pygame.K_ESCAPE
+        )
+
+        self.recording = InputRecording(game.tick_rate, game.random_streams.seed, keys)
+
+    def poll(self, frame: int) -> Sequence[bool]:
+        keys = self.source.poll(frame)
+        self.recording.masks.append(self.recording.get_mask(keys))
+
+        return keys
+
+    def is_quit_requested(self) -> bool:
+        return self.source.is_quit_requested()
+
+    def close(self):
+        self.game.logger.info(f"Saving {len(self.recording)} steps of input to {self.path}")
+        self.recording.save(self.path)
@@ -0,0 +1,32 @@
+from typing import TYPE_CHECKING
+
+from .input_recording import InputRecording
+from .input_source import InputSource
+from .key_state import KeyState
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+
+class ReplayInput(InputSource):
+    def __init__(self, game: "PyCrypts", recording: InputRecording):
+        super().__init__(game)
+
+        self.recording = recording
+
+        # Steps rarely change keys, so each distinct mask is only turned into a KeyState once.
+        self.states: dict[int, KeyState] = {}
+
+    def poll(self, frame: int) -> KeyState:
+        masks = self.recording.masks
+
+        if frame >= len(masks):
+            return KeyState()
+
+        mask = masks[frame]
+        state = self.states.get(mask)
+
+        if state is None:
+            state = self.states[mask] = KeyState(self.recording.get_pressed(mask))
+
+        return state
@@ -0,0 +1,26 @@
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from .input_source import InputSource
+from .key_state import KeyState
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+type InputScript = Callable[[int], Iterable[int]] | dict[int, Iterable[int]]
+
+
+class ScriptedInput(InputSource):
+    def __init__(self, game: "PyCrypts", script: InputScript | None = None):
+        super().__init__(game)
+
+        self.script = script
+        self.empty = KeyState()
+
+    def poll(self, frame: int) -> KeyState:
+        if self.script is None:
+            return self.empty
+
+        if callable(self.script):
+            return KeyState(self.script(frame))
+
+        return KeyState(self.script.get(frame, ()))
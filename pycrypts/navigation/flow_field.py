@@ -0,0 +1,139 @@
+from array import array
+from heapq import heappop, heappush
+from math import inf
+from typing import TYPE_CHECKING
+
+from pygame import Vector2
+
+if TYPE_CHECKING:
+    from .navigation_grid import Cell, NavigationGrid
+
+
+class FlowField:
+    def __init__(self, grid: "NavigationGrid", required: int):
+        self.grid = grid
+        self.required = required
+
+        # What the field was last built for: the grid's epoch and the cells the players stood in.
+        self.epoch = -1
+        self.sources: tuple["Cell", ...] = ()
+
+        self.distances: list[float] = []
+        self.next = array("l")
+
+        self.builds = 0
+
+    def update(self):
+        grid = self.grid
+        grid.update()
+
+        room = grid.room
+        sources = tuple(sorted(
+            grid.get_cell(player.get_actual_center()) for player in room.game.players if player.room is room and player in room.game.registry
+        ))
+
+        if grid.epoch == self.epoch and sources == self.sources:
+            return
+
+        self.epoch = grid.epoch
+        self.sources = sources
+        self.build(sources)
+
+    def build(self, sources: tuple["Cell", ...]):
+        grid = self.grid
+        required = self.required
+
+        columns = grid.columns
+        rows = grid.rows
+        clearance = grid.clearance
+        neighbours = grid.neighbours
+
+        distances = [inf] * (columns * rows)
+        queue: list[tuple[float, int]] = []
+
+        for x, y in sources:
+            index = y * columns + x
+            distances[index] = 0.0
+            heappush(queue, (0.0, index))
+
+        # Dijkstra outwards from every player at once, through the cells a monster of this size fits in.
+        while queue:
+            distance, index = heappop(queue)
+
+            if distance > distances[index]:
+                continue
+
+            y, x = divmod(index, columns)
+
+            for dx, dy, step in neighbours:
+                nx = x + dx
+                ny = y + dy
+
+                if not (0 <= nx < columns and 0 <= ny < rows):
+                    continue
+
+                neighbour = ny * columns + nx
+
+                if clearance[neighbour] < required:
+                    continue
+
+                if dx and dy and (clearance[y * columns + nx] < required or clearance[ny * columns + x] < required):
+                    continue
+
+                new_distance = distance + step
+
+                if new_distance < distances[neighbour]:
+                    distances[neighbour] = new_distance
+                    heappush(queue, (new_distance, neighbour))
+
+        # Each cell points at its closest neighbour, so sampling is a single lookup. Cells a monster
+        # doesn't fit in get pointers too, since one pressed up against a wall may be standing in one.
+        next_cells = array("l", [-1]) * (columns * rows)
+
+        for index in range(columns * rows):
+            if distances[index] == 0:
+                continue
+
+            y, x = divmod(index, columns)
+            best = distances[index]
+
+            for dx, dy, _ in neighbours:
+                nx = x + dx
+                ny = y + dy
+
+                if not (0 <= nx < columns and 0 <= ny < rows):
+                    continue
+
+                neighbour = ny * columns + nx
+
+                if dx and dy and (clearance[y * columns + nx] < required or clearance[ny * columns + x] < required):
+                    continue
+
+                if distances[neighbour] < best:
+                    best = distances[neighbour]
+                    next_cells[index] = neighbour
+
+        self.distances = distances
+        self.next = next_cells
+        self.builds += 1
+
+    def get_next(self, position: Vector2) -> Vector2 | None:
+        # Centre of the next cell towards the nearest player, or None when already there or cut off.
+        self.update()
+
+        x, y = self.grid.get_cell(position)
+        index = self.next[y * self.grid.columns + x]
+
+        if index < 0:
+            return None
+
+        y, x = divmod(index, self.grid.columns)
+
+        return self.grid.get_center((x, y))
+
+    def get_distance(self, position: Vector2) -> float:
+        self.update()
+
+        x, y = self.grid.get_cell(position)
+
+        return self.distances[y * self.grid.columns + x] * self.grid.cell_size
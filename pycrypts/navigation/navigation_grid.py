@@ -0,0 +1,137 @@
+from collections import deque
+from math import ceil, floor
+from typing import TYPE_CHECKING, Iterable
+
+from pygame import Vector2
+
+from .flow_field import FlowField
+
+if TYPE_CHECKING:
+    from ..rooms.room import Room
+    from ..tickable.renderable.collidable.walls.wall import Wall
+
+type Cell = tuple[int, int]
+
+
+class NavigationGrid:
+    # Neighbour offsets with their step costs; diagonals are only taken when both sides are open.
+    neighbours = (
+        (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+        (1, 1, 1.4142135623730951), (1, -1, 1.4142135623730951), (-1, 1, 1.4142135623730951), (-1, -1, 1.4142135623730951)
+    )
+
+    def __init__(self, room: "Room", cell_size: int = 32):
+        self.room = room
+        self.cell_size = cell_size
+
+        self.version = -1
+        self.epoch = 0
+
+        self.columns = 0
+        self.rows = 0
+
+        # Per cell, the Chebyshev distance (in cells) to the nearest blocked cell or the edge of the grid. Zero is blocked.
+        self.clearance = bytearray()
+
+        self.flow_fields: dict[int, FlowField] = {}
+
+    def update(self):
+        version = self.room.get_wall_version()
+
+        if version == self.version:
+            return
+
+        self.version = version
+        self.bake(self.room.get_walls())
+        self.epoch += 1
+
+    def bake(self, walls: Iterable["Wall"]):
+        self.room.game.logger.debug(f"Baking navigation grid for room {type(self.room).__name__}")
+
+        cell_size = self.cell_size
+        columns = ceil(self.room.game.width / cell_size)
+        rows = ceil(self.room.game.height / cell_size)
+
+        clearance = bytearray(b"\xff") * (columns * rows)
+        frontier: deque[int] = deque()
+
+        for wall in walls:
+            if not wall.solid:
+                continue
+
+            left, top, right, bottom = wall.get_bounds()
+
+            for x in range(max(floor(left / cell_size), 0), min(floor(right / cell_size), columns - 1) + 1):
+                for y in range(max(floor(top / cell_size), 0), min(floor(bottom / cell_size), rows - 1) + 1):
+                    index = y * columns + x
+
+                    if clearance[index]:
+                        clearance[index] = 0
+                        frontier.append(index)
+
+        # The edge of the grid counts as a wall one cell outside it.
+        for x in range(columns):
+            for y in (0, rows - 1):
+                index = y * columns + x
+
+                if clearance[index] > 1:
+                    clearance[index] = 1
+                    frontier.append(index)
+
+        for y in range(rows):
+            for x in (0, columns - 1):
+                index = y * columns + x
+
+                if clearance[index] > 1:
+                    clearance[index] = 1
+                    frontier.append(index)
+
+        while frontier:
+            index = frontier.popleft()
+            y, x = divmod(index, columns)
+            distance = clearance[index] + 1
+
+            for dx, dy, _ in self.neighbours:
+                nx = x + dx
+                ny = y + dy
+
+                if 0 <= nx < columns and 0 <= ny < rows:
+                    neighbour = ny * columns + nx
+
+                    if clearance[neighbour] > distance:
+                        clearance[neighbour] = distance
+                        frontier.append(neighbour)
+
+        self.columns = columns
+        self.rows = rows
+        self.clearance = clearance
+
+    def get_cell(self, position: Vector2) -> Cell:
+        x = min(max(floor(position.x / self.cell_size), 0), self.columns - 1)
+        y = min(max(floor(position.y / self.cell_size), 0), self.rows - 1)
+
+        return x, y
+
+    def get_center(self, cell: Cell) -> Vector2:
+        return Vector2((cell[0] + 0.5) * self.cell_size, (cell[1] + 0.5) * self.cell_size)
+
+    def get_flow_field(self, radius: float) -> FlowField:
+        required = self.get_required_clearance(radius)
+        flow_field = self.flow_fields.get(required)
+
+        if flow_field is None:
+            flow_field = self.flow_fields[required] = FlowField(self, required)
+
+        return flow_field
+
+    def get_required_clearance(self, radius: float) -> int:
+        # A box of this half-width centred in a cell clears every blocked cell this many steps away.
+        return ceil(radius / self.cell_size + 0.5)
+
+    def is_walkable(self, cell: Cell, required: int) -> bool:
+        x, y = cell
+
+        if not (0 <= x < self.columns and 0 <= y < self.rows):
+            return False
+
+        return self.clearance[y * self.columns + x] >= required
@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING
+
+from pygame import Vector2
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+    from .navigation_grid import Cell, NavigationGrid
+
+type RouteKey = tuple["NavigationGrid", int, "Cell", int]
+
+
+class Pathfinder:
+    def __init__(self, game: "PyCrypts", budget: int = 4000, max_routes: int = 64):
+        self.game = game
+
+        # Cells A* may expand per simulation step, shared by every monster. A search that starts under budget may finish over it.
+        self.budget = budget
+        self.remaining = budget
+        self.frame = -1
+
+        # Per goal cell, the next cell to step to from every cell a search has routed through. Any tail of a
+        # shortest path is itself a shortest path, so monsters chasing the same player share each other's work.
+        self.max_routes = max_routes
+        self.routes: OrderedDict[RouteKey, dict["Cell", "Cell | None"]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.deferred = 0
+        self.expanded = 0
+
+    def find_path(self, grid: "NavigationGrid", start: Vector2, goal: Vector2, radius: float) -> list[Vector2] | None:
+        # Waypoints from start to goal, or None if there is no route or the search has to wait for a later step.
+        grid.update()
+
+        start_cell = grid.get_cell(start)
+        goal_cell = grid.get_cell(goal)
+        required = grid.get_required_clearance(radius)
+
+        key = (grid, grid.epoch, goal_cell, required)
+        route = self.routes.get(key)
+
+        if route is None:
+            route = self.routes[key] = {goal_cell: goal_cell}
+
+            if len(self.routes) > self.max_routes:
+                self.routes.popitem(last=False)
+        else:
+            self.routes.move_to_end(key)
+
+        if start_cell in route:
+            self.hits += 1
+        else:
+            if self.frame != self.game.frame:
+                self.frame = self.game.frame
+                self.remaining = self.budget
+
+            if self.remaining <= 0:
+                self.deferred += 1
+                return None
+
+            self.misses += 1
+
+            cells = self.search(grid, start_cell, goal_cell, required)
+
+            if cells is None:
+                route[start_cell] = None
+            else:
+                for cell, next_cell in zip(cells, cells[1:]):
+                    route[cell] = next_cell
+
+        if route[start_cell] is None:
+            return None
+
+        waypoints = []
+        cell = route[start_cell]
+
+        while cell != goal_cell:
+            waypoints.append(grid.get_center(cell))
+            cell = route[cell]
+
+        waypoints.append(Vector2(goal))
+
+        return waypoints
+
+    def search(self, grid: "NavigationGrid", start: "Cell", goal: "Cell", required: int) -> tuple["Cell", ...] | None:
+        columns = grid.columns
+        clearance = grid.clearance
+        neighbours = grid.neighbours
+
+        goal_x, goal_y = goal
+
+        costs: dict["Cell", float] = {start: 0.0}
+        parents: dict["Cell", "Cell"] = {}
+        closed: set["Cell"] = set()
+
+        # The counter keeps ties in insertion order, so searches are reproducible.
+        queue: list[tuple[float, int, "Cell"]] = [(0.0, 0, start)]
+        pushed = 1
+
+        while queue:
+            _, _, cell = heappop(queue)
+
+            if cell in closed:
+                continue
+
+            if cell == goal:
+                path = [cell]
+
+                while cell in parents:
+                    cell = parents[cell]
+                    path.append(cell)
+
+                path.reverse()
+                return tuple(path)
+
+            closed.add(cell)
+
+            self.remaining -= 1
+            self.expanded += 1
+
+            x, y = cell
+            cost = costs[cell]
+
+            for dx, dy, step in neighbours:
+                nx = x + dx
+                ny = y + dy
+                neighbour = (nx, ny)
+
+                # The goal is always enterable, since whoever is being chased may stand right against a wall.
+                if neighbour != goal and not grid.is_walkable(neighbour, required):
+                    continue
+
+                if dx and dy and (clearance[y * columns + nx] < required or clearance[ny * columns + x] < required):
+                    continue
+
+                new_cost = cost + step
+
+                if new_cost >= costs.get(neighbour, new_cost + 1):
+                    continue
+
+                costs[neighbour] = new_cost
+                parents[neighbour] = cell
+
+                # Octile distance, which never overestimates on an eight-way grid.
+                distance_x = abs(goal_x - nx)
+                distance_y = abs(goal_y - ny)
+                heuristic = max(distance_x, distance_y) + 0.41421356237309515 * min(distance_x, distance_y)
+
+                heappush(queue, (new_cost + heuristic, pushed, neighbour))
+                pushed += 1
+
+        return None
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "deferred": self.deferred,
+            "expanded": self.expanded,
+            "routes": len(self.routes)
+        }
@@ -0,0 +1,191 @@
+from array import array
+from math import floor, inf
+from typing import TYPE_CHECKING, Iterable
+
+from .visibility_cache import VisibilityCache
+
+if TYPE_CHECKING:
+    from ..rooms.room import Room
+    from ..tickable.renderable.collidable.entities.entity import Entity
+    from ..tickable.renderable.collidable.walls.wall import Wall
+
+
+class LineOfSight:
+    epsilon = 0.001
+
+    def __init__(self, room: "Room", cell_size: int = 128, cache_threshold: float = 2.0):
+        self.room = room
+        self.cell_size = cell_size
+
+        self.cache = VisibilityCache(cache_threshold)
+
+        self.version = -1
+
+        # Four floats per segment: x1, y1, x2, y2.
+        self.segments = array("d")
+        self.cells: dict[tuple[int, int], list[int]] = {}
+
+    def update(self):
+        version = self.room.get_wall_version()
+
+        if version == self.version:
+            return
+
+        self.version = version
+        self.build(self.room.get_walls())
+        self.cache.invalidate()
+
+    def build(self, walls: Iterable["Wall"]):
+        segments = array("d")
+        cells: dict[tuple[int, int], list[int]] = {}
+
+        cell_size = self.cell_size
+        epsilon = self.epsilon
+
+        for wall in walls:
+            for start, end in wall.get_lines():
+                index = len(segments) // 4
+                segments.extend((start.x, start.y, end.x, end.y))
+
+                min_x = floor((min(start.x, end.x) - epsilon) / cell_size)
+                max_x = floor((max(start.x, end.x) + epsilon) / cell_size)
+                min_y = floor((min(start.y, end.y) - epsilon) / cell_size)
+                max_y = floor((max(start.y, end.y) + epsilon) / cell_size)
+
+                for x in range(min_x, max_x + 1):
+                    for y in range(min_y, max_y + 1):
+                        cell = cells.get((x, y))
+
+                        if cell is None:
+                            cell = cells[(x, y)] = []
+
+                        cell.append(index)
+
+        self.segments = segments
+        self.cells = cells
+
+    def sees(self, observer: "Entity", target: "Entity") -> bool:
+        self.update()
+
+        start = observer.get_actual_center()
+        end = target.get_actual_center()
+
+        return self.is_visible(observer, target, start.x, start.y, end.x, end.y)
+
+    def get_visible(self, observer: "Entity", targets: Iterable["Entity"]) -> list["Entity"]:
+        self.update()
+
+        start = observer.get_actual_center()
+        visible = []
+
+        for target in targets:
+            end = target.get_actual_center()
+
+            if self.is_visible(observer, target, start.x, start.y, end.x, end.y):
+                visible.append(target)
+
+        return visible
+
+    def get_observers(self, observers: Iterable["Entity"], target: "Entity") -> list["Entity"]:
+        self.update()
+
+        end = target.get_actual_center()
+        seeing = []
+
+        for observer in observers:
+            start = observer.get_actual_center()
+
+            if self.is_visible(observer, target, start.x, start.y, end.x, end.y):
+                seeing.append(observer)
+
+        return seeing
+
+    def is_visible(self, observer: "Entity", target: "Entity", x1: float, y1: float, x2: float, y2: float) -> bool:
+        visible = self.cache.get(observer, target, x1, y1, x2, y2)
+
+        if visible is None:
+            visible = not self.is_blocked(x1, y1, x2, y2)
+            self.cache.put(observer, target, x1, y1, x2, y2, visible)
+
+        return visible
+
+    def is_blocked(self, x1: float, y1: float, x2: float, y2: float) -> bool:
+        cells = self.cells
+
+        if not cells:
+            return False
+
+        segments = self.segments
+        cell_size = self.cell_size
+
+        cell_x = floor(x1 / cell_size)
+        cell_y = floor(y1 / cell_size)
+        end_x = floor(x2 / cell_size)
+        end_y = floor(y2 / cell_size)
+
+        dx = x2 - x1
+        dy = y2 - y1
+
+        # Amanatides-Woo traversal over the cells the ray passes through.
+        if dx > 0:
+            step_x = 1
+            t_max_x = ((cell_x + 1) * cell_size - x1) / dx
+            t_delta_x = cell_size / dx
+        elif dx < 0:
+            step_x = -1
+            t_max_x = (cell_x * cell_size - x1) / dx
+            t_delta_x = -cell_size / dx
+        else:
+            step_x = 0
+            t_max_x = inf
+            t_delta_x = inf
+
+        if dy > 0:
+            step_y = 1
+            t_max_y = ((cell_y + 1) * cell_size - y1) / dy
+            t_delta_y = cell_size / dy
+        elif dy < 0:
+            step_y = -1
+            t_max_y = (cell_y * cell_size - y1) / dy
+            t_delta_y = -cell_size / dy
+        else:
+            step_y = 0
+            t_max_y = inf
+            t_delta_y = inf
+
+        tested: set[int] = set()
+        remaining = abs(end_x - cell_x) + abs(end_y - cell_y)
+
+        while True:
+            cell = cells.get((cell_x, cell_y))
+
+            if cell is not None:
+                for index in cell:
+                    if index in tested:
+                        continue
+
+                    tested.add(index)
+
+                    offset = index * 4
+                    x3 = segments[offset]
+                    y3 = segments[offset + 1]
+                    x4 = segments[offset + 2]
+                    y4 = segments[offset + 3]
+
+                    # Same orientation tests as Entity.line_intersects, inlined.
+                    if ((y4 - y1) * (x3 - x1) > (y3 - y1) * (x4 - x1)) != ((y4 - y2) * (x3 - x2) > (y3 - y2) * (x4 - x2)) \
+                            and ((y3 - y1) * (x2 - x1) > (y2 - y1) * (x3 - x1)) != ((y4 - y1) * (x2 - x1) > (y2 - y1) * (x4 - x1)):
+                        return True
+
+            if remaining <= 0:
+                return False
+
+            remaining -= 1
+
+            # Never step past the end cell on either axis, even if rounding says otherwise.
+            if cell_y != end_y and (cell_x == end_x or t_max_y <= t_max_x):
+                cell_y += step_y
+                t_max_y += t_delta_y
+            else:
+                cell_x += step_x
+                t_max_x += t_delta_x
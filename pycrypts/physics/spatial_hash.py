@@ -0,0 +1,98 @@
+from math import floor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..tickable.renderable.collidable.collidable import Collidable
+
+type Bounds = tuple[float, float, float, float]
+
+
+class SpatialHash:
+    def __init__(self, cell_size: int = 128):
+        self.cell_size = cell_size
+
+        self.cells: dict[tuple[int, int], dict["Collidable", None]] = {}
+        self.ranges: dict["Collidable", tuple[int, int, int, int]] = {}
+        self.order: dict["Collidable", int] = {}
+
+        self.inserted = 0
+
+    def __contains__(self, collidable: "Collidable") -> bool:
+        return collidable in self.ranges
+
+    def __len__(self):
+        return len(self.ranges)
+
+    def get_range(self, bounds: Bounds) -> tuple[int, int, int, int]:
+        left, top, right, bottom = bounds
+        cell_size = self.cell_size
+
+        return floor(left / cell_size), floor(top / cell_size), floor(right / cell_size), floor(bottom / cell_size)
+
+    def update(self, collidable: "Collidable"):
+        cell_range = self.get_range(collidable.get_bounds())
+        previous = self.ranges.get(collidable)
+
+        if previous == cell_range:
+            return
+
+        if previous is None:
+            self.order[collidable] = self.inserted
+            self.inserted += 1
+        else:
+            self.unlink(collidable, previous)
+
+        self.ranges[collidable] = cell_range
+
+        min_x, min_y, max_x, max_y = cell_range
+        cells = self.cells
+
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                cell = cells.get((x, y))
+
+                if cell is None:
+                    cell = cells[(x, y)] = {}
+
+                cell[collidable] = None
+
+    def remove(self, collidable: "Collidable"):
+        previous = self.ranges.pop(collidable, None)
+
+        if previous is None:
+            return
+
+        del self.order[collidable]
+        self.unlink(collidable, previous)
+
+    def unlink(self, collidable: "Collidable", cell_range: tuple[int, int, int, int]):
+        min_x, min_y, max_x, max_y = cell_range
+        cells = self.cells
+
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                cell = cells.get((x, y))
+
+                if cell is None:
+                    continue
+
+                cell.pop(collidable, None)
+
+                if not cell:
+                    del cells[(x, y)]
+
+    def query(self, bounds: Bounds) -> list["Collidable"]:
+        min_x, min_y, max_x, max_y = self.get_range(bounds)
+        cells = self.cells
+
+        found: dict["Collidable", None] = {}
+
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                cell = cells.get((x, y))
+
+                if cell is not None:
+                    found.update(cell)
+
+        # Results are returned in insertion order so collision side effects stay deterministic.
+        return sorted(found, key=self.order.__getitem__)
@@ -0,0 +1,57 @@
+from math import inf, sqrt
+
+from .spatial_hash import Bounds
+
+
+def get_circle_impact(x: float, y: float, radius: float, dx: float, dy: float, other_x: float, other_y: float, other_radius: float) -> float | None:
+    # Fraction of (dx, dy) after which the moving circle first touches the still one, if it does within the move.
+    offset_x = x - other_x
+    offset_y = y - other_y
+    reach = radius + other_radius
+
+    c = offset_x * offset_x + offset_y * offset_y - reach * reach
+
+    # Already overlapping: the discrete test owns that case, and the mover has to be free to leave.
+    if c < 0:
+        return None
+
+    a = dx * dx + dy * dy
+
+    if a == 0:
+        return None
+
+    b = 2 * (offset_x * dx + offset_y * dy)
+    discriminant = b * b - 4 * a * c
+
+    if discriminant < 0:
+        return None
+
+    time = (-b - sqrt(discriminant)) / (2 * a)
+
+    return time if 0 <= time <= 1 else None
+
+
+def get_box_impact(x: float, y: float, size: float, dx: float, dy: float, bounds: Bounds) -> float | None:
+    # Fraction of (dx, dy) after which the moving square first overlaps the rectangle, if it does within the move.
+    left, top, right, bottom = bounds
+
+    entry_x, exit_x = get_axis_impact(x, x + size, dx, left, right)
+    entry_y, exit_y = get_axis_impact(y, y + size, dy, top, bottom)
+
+    entry = max(entry_x, entry_y)
+    exit = min(exit_x, exit_y)
+
+    if entry > exit or entry < 0 or entry > 1:
+        return None
+
+    return entry
+
+
+def get_axis_impact(low: float, high: float, delta: float, other_low: float, other_high: float) -> tuple[float, float]:
+    if delta == 0:
+        return (-inf, inf) if low <= other_high and other_low <= high else (inf, -inf)
+
+    first = (other_low - high) / delta
+    second = (other_high - low) / delta
+
+    return (first, second) if first <= second else (second, first)
@@ -0,0 +1,98 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..tickable.renderable.collidable.entities.entity import Entity
+
+type VisibilityEntry = tuple[float, float, float, float, bool]
+
+
+class VisibilityCache:
+    def __init__(self, threshold: float = 2.0):
+        # How far (in pixels) either endpoint may drift before a cached result is recomputed.
+        self.threshold = threshold
+        self.threshold_squared = threshold * threshold
+
+        self.epoch = 0
+
+        self.entries: dict[tuple["Entity", "Entity"], VisibilityEntry] = {}
+        self.keys: dict["Entity", set[tuple["Entity", "Entity"]]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, observer: "Entity", target: "Entity", x1: float, y1: float, x2: float, y2: float) -> bool | None:
+        entry = self.entries.get((observer, target))
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        cached_x1, cached_y1, cached_x2, cached_y2, visible = entry
+
+        threshold_squared = self.threshold_squared
+
+        if (x1 - cached_x1) ** 2 + (y1 - cached_y1) ** 2 > threshold_squared \
+                or (x2 - cached_x2) ** 2 + (y2 - cached_y2) ** 2 > threshold_squared:
+            self.invalidations += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return visible
+
+    def put(self, observer: "Entity", target: "Entity", x1: float, y1: float, x2: float, y2: float, visible: bool):
+        key = (observer, target)
+
+        if key not in self.entries:
+            self.keys.setdefault(observer, set()).add(key)
+            self.keys.setdefault(target, set()).add(key)
+
+        self.entries[key] = (x1, y1, x2, y2, visible)
+
+    def invalidate(self):
+        # Called whenever the room's walls change, since any cached ray may now pass through a gap.
+        self.epoch += 1
+
+        self.entries.clear()
+        self.keys.clear()
+
+    def forget(self, entity: "Entity"):
+        keys = self.keys.pop(entity, None)
+
+        if keys is None:
+            return
+
+        for key in keys:
+            self.entries.pop(key, None)
+
+            other = key[1] if key[0] is entity else key[0]
+            other_keys = self.keys.get(other)
+
+            if other_keys is not None:
+                other_keys.discard(key)
+
+                if not other_keys:
+                    del self.keys[other]
+
+    def get_hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self) -> dict[str, int | float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "entries": len(self.entries),
+            "epoch": self.epoch,
+            "hit_rate": self.get_hit_rate()
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
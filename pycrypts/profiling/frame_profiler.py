@@ -0,0 +1,130 @@
+import json
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable
+
+from ..physics.line_of_sight import LineOfSight
+from ..tickable.renderable.collidable.entities.entity import Entity
+from ..tickable.renderable.collidable.entities.living.monsters.monster import Monster
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+
+class FrameProfiler:
+    # Methods timed while a profiler is running, as (class, method, section). They're only wrapped while it runs,
+    # so the game calls the originals directly the rest of the time.
+    instrumented = (
+        (Monster, "ai_tick", "ai"),
+        (Entity, "move_without_collision", "collision"),
+        (LineOfSight, "sees", "line of sight"),
+        (LineOfSight, "get_visible", "line of sight"),
+        (LineOfSight, "get_observers", "line of sight")
+    )
+
+    # Frames averaged for the overlay.
+    window = 60
+
+    # Trace events kept before the oldest start being dropped.
+    max_events = 500_000
+
+    def __init__(self, game: "PyCrypts", trace_path: str | None = None):
+        self.game = game
+        self.trace_path = trace_path
+
+        self.originals: list[tuple[type, str, Callable]] = []
+
+        self.stack: list[tuple[str, float]] = []
+        self.totals: dict[str, float] = {}
+        self.history: deque[dict[str, float]] = deque(maxlen=self.window)
+
+        # Finished sections as (name, start, duration, frame), turned into trace events when saved.
+        self.events: deque[tuple[str, float, float, int]] = deque(maxlen=self.max_events)
+        self.origin = time.perf_counter()
+        self.frames = 0
+
+    def start(self):
+        for owner, name, section in self.instrumented:
+            method = owner.__dict__[name]
+            setattr(owner, name, self.wrap(method, section))
+            self.originals.append((owner, name, method))
+
+    def stop(self):
+        for owner, name, method in reversed(self.originals):
+            setattr(owner, name, method)
+
+        self.originals.clear()
+
+        if self.trace_path is not None:
+            self.save(self.trace_path)
+
+    def wrap(self, method: Callable, section: str) -> Callable:
+        begin = self.begin
+        end = self.end
+
+        def timed(*arguments, **keywords):
+            begin(section)
+            result = method(*arguments, **keywords)
+            end()
+
+            return result
+
+        return timed
+
+    def begin(self, section: str):
+        self.stack.append((section, time.perf_counter()))
+
+    def end(self):
+        section, start = self.stack.pop()
+        duration = time.perf_counter() - start
+
+        # Sections are timed inclusively, so a monster's collision time also counts towards its class's tick.
+        self.totals[section] = self.totals.get(section, 0.0) + duration
+        self.events.append((section, start, duration, self.frames))
+
+    def begin_frame(self):
+        # Anything left open by a frame that ended early is abandoned.
+        self.stack.clear()
+        self.begin("frame")
+
+    def end_frame(self):
+        self.end()
+
+        self.history.append(self.totals)
+        self.totals = {}
+        self.frames += 1
+
+    def get_stats(self) -> dict[str, float]:
+        # Average milliseconds per frame for each section over the last window of frames, slowest first.
+        if not self.history:
+            return {}
+
+        sums: dict[str, float] = {}
+
+        for totals in self.history:
+            for section, duration in totals.items():
+                sums[section] = sums.get(section, 0.0) + duration
+
+        averages = {section: duration * 1000 / len(self.history) for section, duration in sums.items()}
+
+        return dict(sorted(averages.items(), key=lambda item: item[1], reverse=True))
+
+    def save(self, path: str):
+        self.game.logger.info(f"Saving {len(self.events)} profiler events to {path}")
+
+        # Chrome's trace event format, in microseconds. Opens in chrome://tracing and Perfetto.
+        events = [
+            {
+                "name": section,
+                "ph": "X",
+                "ts": (start - self.origin) * 1_000_000,
+                "dur": duration * 1_000_000,
+                "pid": 0,
+                "tid": 0,
+                "args": {"frame": frame}
+            }
+            for section, start, duration, frame in self.events
+        ]
+
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
@@ -0,0 +1,110 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from pygame import Surface
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+    from ..rooms.room import Room
+
+
+class AssetLoader:
+    extensions = (".png", ".svg")
+
+    # Where the characters in a room's manifest live, matching Entity's asset keys.
+    entities = "./assets/images/entities/"
+
+    def __init__(self, game: "PyCrypts"):
+        self.game = game
+
+        # Started the first time anything is preloaded. One thread is plenty, since decoding is mostly disk and SDL.
+        self.executor: ThreadPoolExecutor | None = None
+
+        # Keys still being decoded in the background, each with the batch it belongs to.
+        self.pending: dict[str, Future] = {}
+
+        self.preloaded = 0
+        self.loaded = 0
+        self.waits = 0
+
+    def get(self, key: str) -> Surface:
+        asset = self.game.assets.get(key)
+
+        if asset is not None:
+            return asset
+
+        future = self.pending.get(key)
+
+        if future is not None:
+            if not future.done():
+                self.waits += 1
+
+            self.finish(future)
+            return self.game.assets[key]
+
+        # Anything missing from the manifests is still loaded the old way, on first use.
+        self.loaded += 1
+        asset = self.convert(self.load(key))
+        self.game.assets[key] = asset
+
+        return asset
+
+    def preload(self, room: "Room"):
+        keys = [
+            self.entities + character for character in room.manifest
+            if self.entities + character not in self.game.assets and self.entities + character not in self.pending
+        ]
+
+        if not keys:
+            return
+
+        self.game.logger.debug(f"Preloading {len(keys)} assets for room {type(room).__name__}")
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(1, "asset-loader")
+
+        future = self.executor.submit(self.load_batch, keys)
+
+        for key in keys:
+            self.pending[key] = future
+
+    def load_batch(self, keys: list[str]) -> dict[str, Surface]:
+        # Runs on the loader thread. Only decodes: converting to the display's format stays on the main thread.
+        return {key: self.load(key) for key in keys}
+
+    def load(self, key: str) -> Surface:
+        for extension in self.extensions:
+            if os.path.isfile(key + extension):
+                return self.game.pygame.image.load(key + extension)
+
+        raise FileNotFoundError(f"No image for asset {key}")
+
+    def finish(self, future: Future):
+        images = future.result()
+
+        for key, image in images.items():
+            del self.pending[key]
+            self.game.assets[key] = self.convert(image)
+
+        self.preloaded += len(images)
+
+    def convert(self, surface: Surface) -> Surface:
+        # Converting needs a display mode, which headless runs never set.
+        if self.game.headless:
+            return surface
+
+        return surface.convert_alpha()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "preloaded": self.preloaded,
+            "loaded": self.loaded,
+            "waits": self.waits,
+            "pending": len(self.pending)
+        }
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
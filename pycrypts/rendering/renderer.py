@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING
+
+from pygame import Rect, Surface
+
+from ..enums.render_layer import RenderLayer
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+type Color = tuple[int, int, int] | tuple[int, int, int, int]
+
+
+class Renderer:
+    def __init__(self, game: "PyCrypts"):
+        self.game = game
+
+        self.blits: list[list[tuple[Surface, tuple[float, float]]]] = [[] for _ in RenderLayer]
+        self.fills: list[list[tuple[Color, Rect]]] = [[] for _ in RenderLayer]
+
+    def blit(self, layer: RenderLayer, surface: Surface, position: tuple[float, float]):
+        self.blits[layer].append((surface, position))
+
+    def fill(self, layer: RenderLayer, color: Color, rect: Rect | tuple[float, float, float, float]):
+        self.fills[layer].append((color, Rect(rect)))
+
+    def flush(self, target: Surface) -> list[Rect]:
+        rects = []
+
+        for layer in RenderLayer:
+            fills = self.fills[layer]
+            blits = self.blits[layer]
+
+            # Within a layer, fills go underneath blits, so a health bar's text always lands on top of its bar.
+            for color, rect in fills:
+                rects.append(target.fill(color, rect))
+
+            if blits:
+                rects.extend(target.blits(blits))
+
+            fills.clear()
+            blits.clear()
+
+        return rects
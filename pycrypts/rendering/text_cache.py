@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from pygame import BLEND_RGBA_MAX, Color, Surface
+from pygame.font import Font
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+type FontKey = tuple[str | None, int]
+type TextKey = tuple[str | None, int, tuple[int, ...], str]
+
+
+class TextCache:
+    # Characters baked into glyph atlases, enough for counters and health.
+    glyph_characters = "0123456789-+.,:/% "
+
+    def __init__(self, game: "PyCrypts", max_entries: int = 512):
+        self.game = game
+        self.max_entries = max_entries
+
+        self.fonts: dict[FontKey, Font] = {}
+        self.entries: OrderedDict[TextKey, Surface] = OrderedDict()
+        self.atlases: dict[tuple[str | None, int, tuple[int, ...]], dict[str, Surface]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_font(self, name: str | None, size: int) -> Font:
+        # None is pygame's default font, anything else a system font looked up by name.
+        font = self.fonts.get((name, size))
+
+        if font is None:
+            font = self.game.pygame.font.Font(None, size) if name is None else self.game.pygame.font.SysFont(name, size)
+            self.fonts[(name, size)] = font
+
+        return font
+
+    def render(self, text: str, name: str | None, size: int, color: Color | tuple[int, ...]) -> Surface:
+        key = (name, size, tuple(color), text)
+
+        surface = self.entries.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+
+        surface = self.get_font(name, size).render(text, True, color)
+        self.entries[key] = surface
+
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+        return surface
+
+    def get_glyphs(self, name: str | None, size: int, color: Color | tuple[int, ...]) -> dict[str, Surface]:
+        # Every glyph character rendered once into a single strip, handed out as subsurfaces of it. Text that only
+        # uses these characters can be drawn glyph by glyph, so a value that changes every frame never renders.
+        key = (name, size, tuple(color))
+        glyphs = self.atlases.get(key)
+
+        if glyphs is not None:
+            return glyphs
+
+        font = self.get_font(name, size)
+        rendered = [font.render(character, True, color) for character in self.glyph_characters]
+
+        atlas = Surface((sum(glyph.get_width() for glyph in rendered), max(glyph.get_height() for glyph in rendered)), rendered[0].get_flags(), rendered[0])
+        atlas.fill((0, 0, 0, 0))
+
+        glyphs = {}
+        x = 0
+
+        for character, glyph in zip(self.glyph_characters, rendered):
+            # Copied rather than blended, so the glyphs' own alpha survives.
+            atlas.blit(glyph, (x, 0), special_flags=BLEND_RGBA_MAX)
+            glyphs[character] = atlas.subsurface((x, 0, glyph.get_width(), glyph.get_height()))
+            x += glyph.get_width()
+
+        self.atlases[key] = glyphs
+
+        return glyphs
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "fonts": len(self.fonts),
+            "atlases": len(self.atlases)
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.atlases.clear()
@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from pygame import Surface
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+type TransformKey = tuple[str, float, int, bool]
+
+
+class TransformCache:
+    def __init__(self, game: "PyCrypts", max_bytes: int = 32 * 1024 * 1024, angle_step: int = 5):
+        self.game = game
+
+        self.max_bytes = max_bytes
+        self.angle_step = angle_step
+
+        self.entries: OrderedDict[TransformKey, Surface] = OrderedDict()
+        self.bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, asset: str, size: float, angle: float = 0, flipped: bool = False) -> Surface:
+        key = (asset, size, self.quantize(angle), flipped)
+
+        surface = self.entries.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+
+        surface = self.create(*key)
+
+        self.entries[key] = surface
+        self.bytes += self.get_bytes(surface)
+
+        self.evict()
+
+        return surface
+
+    def create(self, asset: str, size: float, angle: int, flipped: bool) -> Surface:
+        transform = self.game.pygame.transform
+
+        # Rotated and flipped variants are built from the cached scaled one, so the rescale only ever happens once.
+        if angle or flipped:
+            surface = self.get(asset, size)
+        else:
+            surface = transform.scale(self.game.get_asset(asset), (size, size))
+
+        if flipped:
+            surface = transform.flip(surface, True, False)
+
+        if angle:
+            surface = transform.rotate(surface, angle)
+
+        return surface
+
+    def quantize(self, angle: float) -> int:
+        return round(angle / self.angle_step) * self.angle_step % 360
+
+    def evict(self):
+        # The newest entry is never evicted, even if it alone is over budget.
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, surface = self.entries.popitem(last=False)
+            self.bytes -= self.get_bytes(surface)
+            self.evictions += 1
+
+    def get_bytes(self, surface: Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.bytes
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
@@ -18,6 +18,11 @@ class EntranceZone(Room):
     entity_scale = 0.5
     movement_factor = 0.65
 
+    manifest = (
+        "living/players/pro", "living/players/rizzler", "living/monsters/skeleton", "living/monsters/zombie",
+        "saw_trap", "fireball", "arrow", "sword"
+    )
+
     def __init__(self, game: "PyCrypts"):
         spawn_1 = Vector2(game.top_right + (-100, 240))
         spawn_2 = Vector2(game.bottom_right + (-100, -320))
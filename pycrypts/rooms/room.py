@@ -1,7 +1,10 @@
 from typing import TYPE_CHECKING
 
-from pygame import Vector2
+from pygame import Vector2, Surface
 
+from ..navigation.navigation_grid import NavigationGrid
+from ..physics.line_of_sight import LineOfSight
+from ..physics.spatial_hash import SpatialHash
 from ..tickable.renderable.collidable.collidable import Collidable
 from ..tickable.renderable.collidable.entities.living.living_entity import LivingEntity
 from ..tickable.renderable.collidable.walls.wall import Wall
@@ -11,6 +14,9 @@ if TYPE_CHECKING:
 
 
 class Room:
+    # Characters whose images the room's entities use, including anything they spawn, relative to the entity assets.
+    manifest: tuple[str, ...] = ()
+
     def __init__(self, spawn_1: Vector2, spawn_2: Vector2, game: "PyCrypts", entity_scale=1.0, movement_factor=1.0):
         game.logger.info(f"Instantiating room {type(self).__name__}")
 
@@ -21,6 +27,18 @@ class Room:
         self.game = game
         self.created = False
 
+        game.rooms.append(self)
+
+        # Decoding starts straight away on the loader thread, well before the room is first entered.
+        game.asset_loader.preload(self)
+
+        self.spatial_hash = SpatialHash()
+        self.line_of_sight = LineOfSight(self)
+        self.navigation = NavigationGrid(self)
+
+        self.background: Surface | None = None
+        self.background_version = -1
+
     def create(self):
         self.game.logger.info(f"Creating room {type(self).__name__} for the first time")
         self.created = True
@@ -28,16 +46,46 @@ class Room:
     def load(self):
         self.game.logger.info(f"Loading room {type(self).__name__}")
 
+        # Take the room back from the workers before it starts being ticked here again.
+        if self.game.room_workers is not None:
+            self.game.room_workers.collect(self)
+
         self.game.current_room = self
 
         if not self.created:
             self.create()
 
-    def get_collidables(self) -> list[Collidable]:
-        return list(filter(lambda collidable: collidable.room == self, self.game.get_collidables()))
+    def get_collidables(self) -> tuple[Collidable, ...]:
+        return self.game.registry.get(Collidable, self)
+
+    def get_walls(self) -> tuple[Wall, ...]:
+        return self.game.registry.get(Wall, self)
+
+    def get_wall_version(self) -> int:
+        # Changes whenever a wall is added to or removed from the room. Everything baked from the walls (background,
+        # line of sight, navigation) compares it against the version it was built at.
+        return self.game.registry.get_version(Wall, self)
+
+    def get_living_entities(self) -> tuple[LivingEntity, ...]:
+        return self.game.registry.get(LivingEntity, self)
+
+    def get_background(self) -> Surface:
+        version = self.get_wall_version()
+
+        if self.background is None or version != self.background_version:
+            self.background_version = version
+            self.background = self.bake_background(self.get_walls())
+
+        return self.background
+
+    def bake_background(self, walls: tuple[Wall, ...]) -> Surface:
+        self.game.logger.debug(f"Baking background for room {type(self).__name__}")
+
+        background = Surface(self.game.screen.get_size(), 0, self.game.screen)
+        background.fill((0, 0, 0))
 
-    def get_walls(self) -> list[Wall]:
-        return list(filter(lambda collidable: isinstance(collidable, Wall), self.get_collidables()))
+        for wall in walls:
+            if wall.static:
+                wall.draw(background)
 
-    def get_living_entities(self) -> list[LivingEntity]:
-        return list(filter(lambda collidable: isinstance(collidable, LivingEntity), self.get_collidables()))
+        return background
@@ -0,0 +1,212 @@
+import multiprocessing
+import random
+from array import array
+from math import hypot
+from multiprocessing.pool import AsyncResult
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+from pygame import Vector2
+
+from ..tickable.renderable.collidable.entities.entity import Entity
+from ..tickable.renderable.collidable.entities.living.monsters.ai.goals.random_wander import RandomWanderGoal
+from ..tickable.renderable.collidable.entities.living.monsters.monster import Monster
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+    from ..physics.spatial_hash import Bounds
+    from .room import Room
+
+# Doubles per monster in a room's shared buffer: x, y, size, its wander goal's speed, duration, cooldown and
+# randomness, then the wander state carried from one hand-off to the next: wandering, time, direction x and y.
+FIELDS = 11
+
+
+def simulate_room(name: str, count: int, walls: list["Bounds"], obstacles: list[tuple[float, float, float]], steps: int, dt: float, movement: float, seed: int):
+    # Runs in a worker process. Monsters wander the way RandomWanderGoal moves them, taking turns within each step, and a
+    # move along either axis is undone when it would touch a wall, another monster or a fixed obstacle, the same way
+    # Entity.step undoes it in the main process.
+    memory = SharedMemory(name, track=False)
+    state = memory.buf.cast("d")
+
+    generator = random.Random(seed)
+    monsters = [state[index * FIELDS:(index + 1) * FIELDS].tolist() for index in range(count)]
+
+    for _ in range(steps):
+        for index, monster in enumerate(monsters):
+            x, y, size, speed, duration, cooldown, randomness, wandering, time, dx, dy = monster
+
+            if wandering:
+                length = hypot(dx, dy)
+
+                if length > 0:
+                    stride = movement * speed * dt / length
+
+                    if not is_blocked(x + dx * stride, y, size, index, monsters, walls, obstacles):
+                        x += dx * stride
+
+                    if not is_blocked(x, y + dy * stride, size, index, monsters, walls, obstacles):
+                        y += dy * stride
+
+                time += dt
+
+                if time >= duration + generator.uniform(-randomness, randomness):
+                    wandering = 0.0
+                    time = 0.0
+            else:
+                time += dt
+
+                if time >= cooldown + generator.uniform(-randomness, randomness):
+                    dx = generator.uniform(-1, 1)
+                    dy = generator.uniform(-1, 1)
+                    wandering = 1.0
+                    time = 0.0
+
+            monster[:] = x, y, size, speed, duration, cooldown, randomness, wandering, time, dx, dy
+
+    for index, monster in enumerate(monsters):
+        state[index * FIELDS:(index + 1) * FIELDS] = array("d", monster)
+
+    state.release()
+    memory.close()
+
+
+def is_blocked(x: float, y: float, size: float, index: int, monsters: list[list[float]], walls: list["Bounds"], obstacles: list[tuple[float, float, float]]) -> bool:
+    far_x = x + size
+    far_y = y + size
+
+    for left, top, right, bottom in walls:
+        if (left <= x <= right or left <= far_x <= right) and (top <= y <= bottom or top <= far_y <= bottom):
+            return True
+
+    # Entities touch when their centres are closer than their radii, as in Entity.is_colliding.
+    for other, monster in enumerate(monsters):
+        if other != index and is_touching(x, y, size, monster[0], monster[1], monster[2]):
+            return True
+
+    return any(is_touching(x, y, size, other_x, other_y, other_size) for other_x, other_y, other_size in obstacles)
+
+
+def is_touching(x: float, y: float, size: float, other_x: float, other_y: float, other_size: float) -> bool:
+    reach = size / 2 + other_size / 2
+    return (x - other_x) ** 2 + (y - other_y) ** 2 < reach * reach
+
+
+class RoomWorkers:
+    # Steps between hand-offs. Results are always collected on these boundaries, however quickly the workers
+    # finish, so worker timing never changes the simulation.
+    interval = 30
+
+    def __init__(self, game: "PyCrypts", processes: int):
+        self.game = game
+        self.processes = processes
+
+        self.pool = None
+
+        self.jobs: dict["Room", tuple[AsyncResult, SharedMemory, list[Monster]]] = {}
+
+    def update(self):
+        if self.game.frame % self.interval:
+            return
+
+        for index, room in enumerate(self.game.rooms):
+            if room is self.game.current_room:
+                continue
+
+            self.collect(room)
+            self.submit(room, index)
+
+    def submit(self, room: "Room", index: int):
+        monsters = [monster for monster in room.get_living_entities() if isinstance(monster, Monster)]
+
+        if not monsters:
+            return
+
+        if self.pool is None:
+            # Spawned rather than forked, so workers don't inherit SDL's state.
+            self.pool = multiprocessing.get_context("spawn").Pool(self.processes)
+
+        memory = SharedMemory(create=True, size=len(monsters) * FIELDS * 8)
+        state = memory.buf.cast("d")
+
+        for monster_index, monster in enumerate(monsters):
+            offset = monster_index * FIELDS
+            state[offset:offset + FIELDS] = array("d", self.get_state(monster))
+
+        state.release()
+
+        walls = [wall.get_bounds() for wall in room.get_walls() if wall.solid]
+        # Anything else that blocks, such as traps, stays where it is while the room is away.
+        obstacles = [
+            (entity.position.x, entity.position.y, entity.size) for entity in room.get_collidables()
+            if isinstance(entity, Entity) and not isinstance(entity, Monster) and not entity.no_clip
+        ]
+        seed = self.game.random_streams.derive(self.game.frame, index)
+
+        job = self.pool.apply_async(simulate_room, (memory.name, len(monsters), walls, obstacles, self.interval, self.game.dt, 250 * room.movement_factor, seed))
+        self.jobs[room] = (job, memory, monsters)
+
+    def collect(self, room: "Room"):
+        # Waits for the room's outstanding job, if any, and moves its monsters to where the worker left them.
+        entry = self.jobs.pop(room, None)
+
+        if entry is None:
+            return
+
+        job, memory, monsters = entry
+        job.get()
+
+        state = memory.buf.cast("d")
+
+        for monster_index, monster in enumerate(monsters):
+            if monster not in self.game.registry or monster.room is not room:
+                continue
+
+            offset = monster_index * FIELDS
+            self.set_state(monster, state[offset:offset + FIELDS].tolist())
+
+        state.release()
+        memory.close()
+        memory.unlink()
+
+    @staticmethod
+    def get_wander_goal(monster: Monster) -> RandomWanderGoal | None:
+        return next((goal for goal in monster.goals if isinstance(goal, RandomWanderGoal)), None)
+
+    def get_state(self, monster: Monster) -> list[float]:
+        goal = self.get_wander_goal(monster)
+
+        # Monsters that never wander just hold their place.
+        if goal is None:
+            return [monster.position.x, monster.position.y, monster.size, 0, 0, 0, 0, 0, 0, 0, 0]
+
+        direction = goal.wander_direction or (0, 0)
+        time = goal.wander_time if goal.wandering else goal.idle_time
+
+        return [
+            monster.position.x, monster.position.y, monster.size,
+            goal.speed, goal.wander_duration, goal.wander_cooldown, goal.randomness,
+            goal.wandering, time, direction[0], direction[1]
+        ]
+
+    def set_state(self, monster: Monster, values: list[float]):
+        x, y, _, _, _, _, _, wandering, time, dx, dy = values
+        monster.teleport((x, y))
+
+        goal = self.get_wander_goal(monster)
+
+        if goal is None:
+            return
+
+        goal.wandering = bool(wandering)
+        goal.wander_time = time if goal.wandering else 0
+        goal.idle_time = 0 if goal.wandering else time
+        goal.wander_direction = Vector2(dx, dy)
+
+    def close(self):
+        for room in list(self.jobs):
+            self.collect(room)
+
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
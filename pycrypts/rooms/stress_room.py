@@ -0,0 +1,81 @@
+from typing import TYPE_CHECKING
+
+from pygame import Vector2
+
+from .room import Room
+from ..tickable.renderable.collidable.entities.living.monsters.skeleton import Skeleton
+from ..tickable.renderable.collidable.entities.living.monsters.zombie import Zombie
+from ..tickable.renderable.collidable.entities.traps.saw_trap import SawTrap
+from ..tickable.renderable.collidable.walls.wall import Wall
+
+if TYPE_CHECKING:
+    from ..game import PyCrypts
+
+
+class StressRoom(Room):
+    # A walled arena filled with generated monsters, pillars and saw traps, used by the benchmarks.
+    entity_scale = 0.5
+    movement_factor = 0.65
+
+    manifest = (
+        "living/players/pro", "living/players/rizzler", "living/monsters/skeleton", "living/monsters/zombie",
+        "saw_trap", "fireball", "arrow", "sword"
+    )
+
+    border = 50
+    pillar_size = 40
+
+    def __init__(self, game: "PyCrypts", monsters: int, walls: int, traps: int):
+        spawn_1 = Vector2(game.center + (-40, 0))
+        spawn_2 = Vector2(game.center + (40, 0))
+
+        self.monsters = monsters
+        self.walls = walls
+        self.traps = traps
+
+        super().__init__(spawn_1, spawn_2, game, StressRoom.entity_scale, StressRoom.movement_factor)
+
+    def create(self):
+        super().create()
+
+        game = self.game
+        random = game.random_streams.create()
+        border = StressRoom.border
+
+        Wall(game.top_left, game.bottom_left + (border, 0), game, self)
+        Wall(game.top_right + (-border, 0), game.bottom_right, game, self)
+        Wall(game.top_left, game.top_right + (0, border), game, self)
+        Wall(game.bottom_left + (0, -border), game.bottom_right, game, self)
+
+        # Pillars are kept away from the players' spawns so the players always start free to move.
+        for _ in range(self.walls):
+            while True:
+                x = random.uniform(border, game.width - border - StressRoom.pillar_size)
+                y = random.uniform(border, game.height - border - StressRoom.pillar_size)
+
+                if Vector2(x, y).distance_to(game.center) > 150:
+                    break
+
+            Wall((x, y), (x + StressRoom.pillar_size, y + StressRoom.pillar_size), game, self)
+
+        # Saw traps sweep up and down columns spread evenly across the room.
+        for trap in range(self.traps):
+            x = border + (trap + 0.5) * (game.width - 2 * border) / self.traps
+            SawTrap(Vector2(x, border + 32), Vector2(x, game.height - border - 64), 64, game, self)
+
+        size = 64 * StressRoom.entity_scale
+        pillars = [wall.get_bounds() for wall in self.get_walls()]
+
+        for monster in range(self.monsters):
+            # Positions that land on a pillar are re-rolled a few times before giving up and using them anyway.
+            for _ in range(16):
+                x = random.uniform(border, game.width - border - size)
+                y = random.uniform(border, game.height - border - size)
+
+                if not any(left - size < x < right and top - size < y < bottom for left, top, right, bottom in pillars):
+                    break
+
+            if monster % 2:
+                Zombie((x, y), 64, game, self)
+            else:
+                Skeleton((x, y), 64, game, self)
@@ -11,6 +11,11 @@ if TYPE_CHECKING:
 
 
 class SurfaceZone(Room):
+    manifest = (
+        "living/players/pro", "living/players/rizzler", "living/monsters/skeleton", "living/monsters/zombie",
+        "fireball", "arrow", "sword"
+    )
+
     def __init__(self, game: "PyCrypts"):
         spawn_1 = (game.top_right + (-200, 240))
         spawn_2 = (game.bottom_right + (-200, -320))
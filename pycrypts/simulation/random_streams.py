@@ -0,0 +1,26 @@
+import os
+import random
+
+
+class RandomStreams:
+    # Odd 64-bit constant that scatters neighbouring stream numbers across the seed space.
+    spread = 0x9E3779B97F4A7C15
+
+    def __init__(self, seed: int | None = None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8))
+
+        # Kept to 64 bits so it fits in an input recording's header.
+        self.seed = seed % 2 ** 64
+        self.created = 0
+
+    def create(self) -> random.Random:
+        # Streams are numbered in creation order, so the same run of spawns always gets the same streams.
+        stream = random.Random(self.seed * self.spread + self.created)
+        self.created += 1
+
+        return stream
+
+    def derive(self, *keys: int) -> int:
+        # A seed for work done outside the main process, fixed by the game's seed and the given keys.
+        return random.Random(repr((self.seed, *keys))).getrandbits(64)
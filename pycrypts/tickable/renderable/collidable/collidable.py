@@ -4,15 +4,50 @@ from ..renderable import Renderable
 
 if TYPE_CHECKING:
     from ....game import PyCrypts
+    from ....physics.spatial_hash import Bounds
     from ....rooms.room import Room
 
 
 class Collidable(Renderable):
-
     def __init__(self, game: "PyCrypts", room: "Room"):
         super().__init__(game)
         self.room = room
 
+    @property
+    def room(self) -> "Room":
+        return self._room
+
+    @room.setter
+    def room(self, room: "Room"):
+        previous = getattr(self, "_room", None)
+        self._room = room
+        self.game.registry.move(self, room)
+
+        if previous is not None and previous is not room:
+            previous.spatial_hash.remove(self)
+            self.update_broadphase()
+
+    def load(self):
+        super().load()
+        self.update_broadphase()
+
+    def unload(self):
+        super().unload()
+
+        if self.room is not None:
+            self.room.spatial_hash.remove(self)
+
+    def update_broadphase(self):
+        room = getattr(self, "_room", None)
+
+        if room is None or self not in self.game.registry:
+            return
+
+        room.spatial_hash.update(self)
+
+    def get_bounds(self) -> "Bounds":
+        pass
+
     def is_inside_hitbox(self, location: tuple[int, int]) -> bool:
         pass
 
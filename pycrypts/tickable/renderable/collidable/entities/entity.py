@@ -4,43 +4,94 @@ from typing import TYPE_CHECKING
 from pygame import Vector2
 
 from ..collidable import Collidable
+from .....enums.render_layer import RenderLayer
+from .....physics.sweep import get_box_impact, get_circle_impact
 
 if TYPE_CHECKING:
     from .....game import PyCrypts
+    from .....physics.spatial_hash import Bounds
     from .....rooms.room import Room
 
 
 class Entity(Collidable):
-    def __init__(self, position: tuple[int, int] | Vector2, character: str, size: int, game: "PyCrypts", room: "Room"):
-        super().__init__(game, room)
+    layer = RenderLayer.ENTITIES
+    poolable = False
+
+    # Swept entities are stopped at their first impact when a single step could carry them past it.
+    swept = False
+
+    # Simulation steps covered by one tick, for entities that are ticked less often than every step.
+    step_scale = 1
 
-        self.position = Vector2(position)
+    def __init__(self, position: tuple[int, int] | Vector2, character: str, size: int, game: "PyCrypts", room: "Room"):
+        self._position = Vector2(position)
+        self.previous_position = Vector2(position)
         self.velocity = Vector2(0, 0)
 
+        self.absolute_size = size
+        self.size = size
+
+        self.no_clip = False
+        self.pooled = False
+
+        # Each entity draws from its own stream, so one entity's rolls never shift another's.
+        self.random = game.random_streams.create()
+
+        super().__init__(game, room)
+
         self.game = game
 
-        self.image = self.game.get_asset("./assets/images/entities/" + character)
+        self.asset = "./assets/images/entities/" + character
 
-        self.base_image = self.image
+        self.set_scale(room.entity_scale)
 
-        self.absolute_size = size
-        self.size = size
+    def reset(self, position: tuple[int, int] | Vector2, room: "Room"):
+        # Readies a pooled entity for reuse while it is unloaded. Call load() afterwards.
+        self.room = room
+
+        self._position = Vector2(position)
+        self.previous_position = Vector2(position)
+        self.velocity = Vector2(0, 0)
 
         self.no_clip = False
 
         self.set_scale(room.entity_scale)
 
-        self.base_image = self.image
+    @property
+    def position(self) -> Vector2:
+        return self._position
+
+    @position.setter
+    def position(self, position: tuple[int, int] | Vector2):
+        self._position = Vector2(position)
+        self.update_broadphase()
+
+    def unload(self):
+        loaded = self in self.game.registry
+
+        super().unload()
+        self.room.line_of_sight.cache.forget(self)
+
+        if loaded and self.poolable:
+            self.game.entity_pool.release(self)
+
+    def teleport(self, position: tuple[int, int] | Vector2):
+        self.position = position
+        self.previous_position = Vector2(position)
+
+    def get_render_position(self) -> Vector2:
+        return self.previous_position.lerp(self.position, self.game.alpha)
 
     def render(self):
-        self.game.screen.blit(self.image, self.position)
+        self.game.renderer.blit(self.layer, self.image, self.get_render_position())
 
     def tick(self):
+        self.previous_position = Vector2(self.position)
         self.move()
-        self.render()
 
     def move(self):
         self.move_without_collision(self.velocity)
+
         self.velocity *= 0.1
 
         if self.velocity.magnitude_squared() < 0.1:
@@ -54,27 +105,100 @@ class Entity(Collidable):
         if magnitude_squared == 0:
             return
 
-        collidables = self.room.get_collidables()
+        distance_travelled = (distance_travelled / sqrt(magnitude_squared)) * self.get_stride(speed_factor)
 
-        distance_travelled = (distance_travelled / sqrt(magnitude_squared)) * 250 * self.game.current_room.movement_factor * speed_factor * self.game.dt
+        left, top, right, bottom = self.get_bounds()
+        candidates = self.room.spatial_hash.query((
+            left + min(distance_travelled.x, 0),
+            top + min(distance_travelled.y, 0),
+            right + max(distance_travelled.x, 0),
+            bottom + max(distance_travelled.y, 0)
+        ))
 
-        filtered = list(filter(lambda c: c != self, collidables))
+        filtered = [c for c in candidates if c is not self]
 
-        self.position.x += distance_travelled.x
+        if self.swept and distance_travelled.magnitude_squared() > (self.size / 2) ** 2:
+            impact = self.get_time_of_impact(filtered, distance_travelled)
+
+            if impact is not None:
+                # Go a little past the point of contact so the usual checks register the hit.
+                fraction = min(1, impact + self.size / 4 / distance_travelled.magnitude())
+
+                # Projectiles unload themselves on a hit and may still report no collision.
+                if self.step(distance_travelled * fraction, filtered) or self not in self.game.registry:
+                    self.update_broadphase()
+                    return
+
+                distance_travelled = distance_travelled * (1 - fraction)
+
+        self.step(distance_travelled, filtered)
+        self.update_broadphase()
+
+    def get_stride(self, speed_factor: float = 1) -> float:
+        return 250 * self.room.movement_factor * speed_factor * self.game.dt * self.step_scale
+
+    def step(self, distance_travelled: Vector2, filtered: list[Collidable]) -> bool:
+        # Moved in place, without touching the broadphase until the step is done.
+        x, y = self.position
+
+        x += distance_travelled.x
+        self._position.update(x, y)
         collision_x = any(self.is_colliding(collidable) or collidable.is_colliding(self) for collidable in filtered)
         if collision_x:
-            self.position.x -= distance_travelled.x
+            x -= distance_travelled.x
+            self._position.update(x, y)
 
-        self.position.y += distance_travelled.y
+        y += distance_travelled.y
+        self._position.update(x, y)
         collision_y = any(self.is_colliding(collidable) or collidable.is_colliding(self) for collidable in filtered)
         if collision_y:
-            self.position.y -= distance_travelled.y
+            y -= distance_travelled.y
+            self._position.update(x, y)
+
+        return collision_x or collision_y
+
+    def get_time_of_impact(self, candidates: list[Collidable], distance_travelled: Vector2) -> float | None:
+        if self.no_clip:
+            return None
+
+        from ..walls.wall import Wall
+
+        x, y = self.position
+        dx, dy = distance_travelled
+        radius = self.size / 2
+
+        impact = None
+
+        for candidate in candidates:
+            if isinstance(candidate, Entity):
+                if candidate.no_clip:
+                    continue
+
+                other = candidate.position
+                time = get_circle_impact(x, y, radius, dx, dy, other.x, other.y, candidate.size / 2)
+            elif isinstance(candidate, Wall) and candidate.solid:
+                time = get_box_impact(x, y, self.size, dx, dy, candidate.get_bounds())
+            else:
+                continue
+
+            if time is not None and (impact is None or time < impact):
+                impact = time
+
+        return impact
 
     def move_towards(self, entity: "Entity", speed_factor: float = 1):
         self.move_towards_location(entity.position, speed_factor)
 
     def move_towards_location(self, location: Vector2, speed_factor: float = 1):
         distance = location - self.position
+
+        # A long stride, as in background steps, stops on the location instead of passing over it.
+        stride = self.get_stride(speed_factor)
+        remaining = distance.magnitude()
+
+        if 0 < remaining < stride:
+            speed_factor *= remaining / stride
+
         self.move_without_collision(distance, speed_factor)
 
     def move_away_from(self, entity: "Entity", speed_factor: float = 1):
@@ -96,7 +220,16 @@ class Entity(Collidable):
 
     def set_scale(self, scale: float):
         self.size = self.absolute_size * scale
-        self.image = self.game.pygame.transform.scale(self.base_image, (self.size, self.size))
+
+        self.image = self.game.transforms.get(self.asset, self.size)
+        self.base_image = self.image
+
+        self.update_broadphase()
+
+    def get_bounds(self) -> "Bounds":
+        # Covers both the square hitbox used against walls and the circle used against other entities.
+        radius = self.size / 2
+        return self.position.x - radius, self.position.y - radius, self.position.x + self.size, self.position.y + self.size
 
     def get_radius(self):
         return self.size / 2.0
@@ -123,16 +256,7 @@ class Entity(Collidable):
         return [self.get_top_left(), self.get_bottom_right(), self.get_top_right(), self.get_bottom_left()]
 
     def sees_other(self, other: "Entity") -> bool:
-        center = self.get_actual_center()
-        other_center = other.get_actual_center()
-
-        for wall in self.room.get_walls():
-            wall_edges = wall.get_lines()  # Assume this returns [(p1, p2), (p2, p3), (p3, p4), (p4, p1)]
-            for edge in wall_edges:
-                if self.line_intersects(center, other_center, edge[0], edge[1]):
-                    return False
-
-        return True
+        return self.room.line_of_sight.sees(self, other)
 
     def line_intersects(self, a1: Vector2, a2: Vector2, b1: Vector2, b2: Vector2) -> bool:
         return self.ccw(a1, b1, b2) != self.ccw(a2, b1, b2) and self.ccw(a1, a2, b1) != self.ccw(a1, a2, b2)
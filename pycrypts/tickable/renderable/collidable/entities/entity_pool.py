@@ -0,0 +1,51 @@
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from ....game import PyCrypts
+    from .entity import Entity
+
+E = TypeVar("E", bound="Entity")
+
+
+class EntityPool:
+    def __init__(self, game: "PyCrypts", max_size: int = 256):
+        self.game = game
+        self.max_size = max_size
+
+        self.free: dict[type, list["Entity"]] = {}
+
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, cls: type[E]) -> E | None:
+        free = self.free.get(cls)
+
+        if not free:
+            self.created += 1
+            return None
+
+        entity = free.pop()
+        entity.pooled = False
+
+        self.reused += 1
+
+        return entity
+
+    def release(self, entity: "Entity"):
+        if entity.pooled:
+            return
+
+        free = self.free.setdefault(type(entity), [])
+
+        if len(free) >= self.max_size:
+            return
+
+        entity.pooled = True
+        free.append(entity)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "free": sum(len(free) for free in self.free.values())
+        }
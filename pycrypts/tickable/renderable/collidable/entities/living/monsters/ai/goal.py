@@ -4,9 +4,13 @@ from ..monster import Monster
 
 if TYPE_CHECKING:
     from ........game import PyCrypts
+    from ....entity import Entity
 
 
 class Goal:
+    # Seconds between can_use() checks; in between, the scheduler reuses the last answer. Zero checks every step.
+    evaluation_interval = 0.0
+
     def __init__(self, owner: Monster, priority: int, game: "PyCrypts"):
         self.owner = owner
         self.priority = priority
@@ -23,3 +27,7 @@ class Goal:
 
     def can_use(self) -> bool:
         return True
+
+    # What the goal is acting on, if anything, so the scheduler can tell when a reused answer has gone stale.
+    def get_target(self) -> "Entity | None":
+        return None
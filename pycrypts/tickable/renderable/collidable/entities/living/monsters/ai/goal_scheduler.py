@@ -0,0 +1,101 @@
+from bisect import insort
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ........game import PyCrypts
+    from ..monster import Monster
+    from .goal import Goal
+
+
+class GoalScheduler:
+    def __init__(self, owner: "Monster", game: "PyCrypts"):
+        self.owner = owner
+        self.game = game
+
+        # Kept in priority order, so the first usable goal is the one that runs.
+        self.goals: list["Goal"] = []
+        self.current: "Goal | None" = None
+
+        self.usable: dict["Goal", bool] = {}
+        self.next_evaluation: dict["Goal", float] = {}
+
+        # Spreads monsters' first re-evaluations over the interval, so they don't all land on one step.
+        self.offset = owner.random.random()
+
+        self.times: dict["Goal", float] = {}
+        self.evaluations = 0
+        self.skipped = 0
+
+    def __iter__(self):
+        return iter(self.goals)
+
+    def __len__(self):
+        return len(self.goals)
+
+    def add(self, goal: "Goal"):
+        # Goals of equal priority keep the order they were added in.
+        insort(self.goals, goal, key=lambda g: g.priority)
+        self.times[goal] = 0.0
+
+    def tick(self):
+        for goal in self.goals:
+            if self.is_usable(goal):
+                break
+        else:
+            return
+
+        if goal is not self.current:
+            if self.current is not None:
+                self.current.end()
+
+                # An ended goal drops what it cached, so its last answer can't be reused.
+                self.usable.pop(self.current, None)
+
+            goal.start()
+
+        start = perf_counter()
+        goal.tick()
+        self.times[goal] += perf_counter() - start
+
+        self.current = goal
+
+    def is_usable(self, goal: "Goal") -> bool:
+        interval = goal.evaluation_interval
+        now = self.game.frame * self.game.dt
+
+        # A target unloaded or gone to another room since the last check means the last answer no longer holds.
+        if interval > 0 and goal in self.usable and now < self.next_evaluation[goal] and self.is_target_valid(goal):
+            self.skipped += 1
+            return self.usable[goal]
+
+        start = perf_counter()
+        usable = goal.can_use()
+        self.times[goal] += perf_counter() - start
+
+        self.evaluations += 1
+
+        if interval > 0:
+            first = goal not in self.next_evaluation
+            self.next_evaluation[goal] = now + interval * (self.offset if first else 1)
+
+        self.usable[goal] = usable
+
+        return usable
+
+    def is_target_valid(self, goal: "Goal") -> bool:
+        target = goal.get_target()
+        return target is None or (target in self.game.registry and target.room is self.owner.room)
+
+    def get_stats(self) -> dict[str, float]:
+        stats: dict[str, float] = {}
+
+        # Goals of the same class share an entry, so none overwrites another.
+        for goal, time in self.times.items():
+            name = type(goal).__name__
+            stats[name] = stats.get(name, 0.0) + time
+
+        stats["evaluations"] = self.evaluations
+        stats["skipped"] = self.skipped
+
+        return stats
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
 
 
 class BackOffFromTargetGoal(WalkToTargetGoal):
+    # Backing off only makes sense from something in plain view.
+    pursuit_time = 0
+
     def __init__(self, owner: "Monster", priority: int, game: "PyCrypts", speed=1, distance_threshold=100):
         super().__init__(owner, priority, game, speed)
 
@@ -1,5 +1,3 @@
-import random
-
 from pygame import Vector2
 
 from ..goal import Goal
@@ -27,14 +25,14 @@ class RandomWanderGoal(Goal):
         if self.wandering:
             if move:
                 self.owner.move_without_collision(self.wander_direction, self.speed)
-            self.wander_time += self.game.dt
+            self.wander_time += self.game.dt * self.owner.step_scale
 
-            if self.wander_time >= self.wander_duration + random.uniform(-self.randomness, self.randomness):
+            if self.wander_time >= self.wander_duration + self.owner.random.uniform(-self.randomness, self.randomness):
                 self.stop_wandering()
         else:
-            self.idle_time += self.game.dt
+            self.idle_time += self.game.dt * self.owner.step_scale
 
-            if self.idle_time >= self.wander_cooldown + random.uniform(-self.randomness, self.randomness):
+            if self.idle_time >= self.wander_cooldown + self.owner.random.uniform(-self.randomness, self.randomness):
                 self.start_wandering()
 
     def end(self):
@@ -44,7 +42,7 @@ class RandomWanderGoal(Goal):
         return super().can_use()
 
     def start_wandering(self):
-        self.wander_direction = Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
+        self.wander_direction = Vector2(self.owner.random.uniform(-1, 1), self.owner.random.uniform(-1, 1))
         self.wandering = True
         self.idle_time = 0
 
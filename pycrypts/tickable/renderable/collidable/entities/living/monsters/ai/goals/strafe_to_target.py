@@ -1,5 +1,4 @@
 import math
-import random
 
 from pygame import Vector2
 
@@ -23,12 +22,16 @@ class StrafeToTargetGoal(WalkToTargetGoal):
         super().start()
 
     def tick(self):
+        if self.pursuing:
+            super().tick()
+            return
+
         if self.owner.velocity.magnitude() > 0:
             return
 
-        self.strafe_timer += self.game.dt
+        self.strafe_timer += self.game.dt * self.owner.step_scale
 
-        if self.strafe_timer >= 1 + random.uniform(-0.15, 0.15):
+        if self.strafe_timer >= 1 + self.owner.random.uniform(-0.15, 0.15):
             self.strafe_direction = -self.strafe_direction
             self.strafe_timer = 0
 
@@ -9,12 +9,20 @@ if TYPE_CHECKING:
 
 
 class WalkToTargetGoal(Goal):
+    evaluation_interval = 0.1
+
+    # Seconds a target that slipped out of sight is still chased, around walls, before giving up.
+    pursuit_time = 3.0
+
     def __init__(self, owner: Monster, priority: int, game: "PyCrypts", speed=1):
         super().__init__(owner, priority, game)
 
         self.speed = speed
         self.cached_target: Player | None = None
 
+        self.last_seen = 0
+        self.pursuing = False
+
     def start(self):
         pass
 
@@ -22,20 +30,61 @@ class WalkToTargetGoal(Goal):
         if self.owner.velocity.magnitude_squared() > 0:
             return
 
+        if self.pursuing:
+            self.follow_path()
+            return
+
         self.owner.move_towards(self.cached_target, self.speed)
 
+    def follow_path(self):
+        radius = self.owner.get_radius()
+        start = self.owner.get_actual_center()
+
+        # The room's flow field already leads to the nearest player, so it only takes a lookup.
+        waypoint = self.owner.room.navigation.get_flow_field(radius).get_next(start)
+
+        if waypoint is None:
+            path = self.game.pathfinder.find_path(self.owner.room.navigation, start, self.cached_target.get_actual_center(), radius)
+            waypoint = path[0] if path else None
+
+        # No route yet (or at all) still leaves the straight line.
+        if waypoint is None:
+            self.owner.move_towards(self.cached_target, self.speed)
+            return
+
+        self.owner.move_towards_location(waypoint - (radius, radius), self.speed)
+
     def end(self):
         self.cached_target = None
+        self.pursuing = False
         pass
 
     def can_use(self) -> bool:
         return super().can_use() and self.get_nearby_targets_and_cache() is not None
 
+    def get_target(self) -> Player | None:
+        return self.cached_target
+
     def get_nearby_targets_and_cache(self) -> Player | None:
-        players = list(filter(lambda p: self.owner.sees_other(p), self.game.players))
+        players = self.owner.room.line_of_sight.get_visible(self.owner, self.owner.get_players())
 
         if len(players) == 0:
-            return None
+            return self.get_pursued_target()
 
         self.cached_target = min(players, key=lambda p: self.owner.position.distance_squared_to(p.position))
+        self.last_seen = self.game.frame
+        self.pursuing = False
+
         return self.cached_target
+
+    def get_pursued_target(self) -> Player | None:
+        target = self.cached_target
+
+        if target is None or target not in self.game.registry or target.room is not self.owner.room \
+                or (self.game.frame - self.last_seen) * self.game.dt >= self.pursuit_time:
+            self.cached_target = None
+            self.pursuing = False
+            return None
+
+        self.pursuing = True
+        return target
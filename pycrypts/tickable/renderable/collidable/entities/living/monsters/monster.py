@@ -1,22 +1,31 @@
 from typing import TYPE_CHECKING
 
+from pygame import Vector2
+
+from .ai.goal_scheduler import GoalScheduler
 from ..living_entity import LivingEntity
 
 if TYPE_CHECKING:
     from .......game import PyCrypts
     from .......rooms.room import Room
-    from .ai.goal import Goal
+    from ..players.player import Player
 
 
 class Monster(LivingEntity):
     attack_interval = 1.0
 
+    # Monsters further than this from every player only think and move every few steps, in bigger strides.
+    lod_distance = 480
+    lod_interval = 4
+
     def __init__(self, position: tuple[int, int], monster: str, size: int, health: int, game: "PyCrypts", room: "Room"):
         super().__init__(position, "monsters/" + monster, size, health, game, room)
         self.attack_timer = 0
         self.game = game
-        self.goals: list["Goal"] = []
-        self.last_ticked_goal = None
+        self.goals = GoalScheduler(self, game)
+
+        # Spreads distant monsters' ticks over the interval instead of bunching them on one step.
+        self.lod_offset = len(room.get_living_entities()) % self.lod_interval
 
         self.register_goals()
 
@@ -24,32 +33,41 @@ class Monster(LivingEntity):
         pass
 
     def tick(self):
+        if self.room is self.game.current_room:
+            distant = self.is_distant()
+
+            if distant and (self.game.frame + self.lod_offset) % self.lod_interval:
+                self.previous_position = Vector2(self.position)
+                return
+
+            self.step_scale = self.lod_interval if distant else 1
+
         super().tick()
         self.ai_tick()
 
-        self.attack_timer += self.game.dt
+        self.attack_timer += self.game.dt * self.step_scale
 
         if self.attack_timer >= self.attack_interval:
             self.attack_timer = 0
             self.attack()
 
     def ai_tick(self):
-        usable_goals : list["Goal"] = list(filter(lambda g: g.can_use(), self.goals))
-        if len(usable_goals) == 0:
-            return
+        self.goals.tick()
+
+    def is_distant(self) -> bool:
+        players = self.get_players()
 
-        highest_priority = list(sorted(usable_goals, key=lambda g: g.priority))[0]
+        if not players:
+            return True
 
-        if highest_priority != self.last_ticked_goal:
-            if self.last_ticked_goal is not None:
-                self.last_ticked_goal.end()
-            highest_priority.start()
+        threshold = self.lod_distance * self.room.entity_scale
+        return min(self.position.distance_squared_to(player.position) for player in players) > threshold * threshold
 
-        highest_priority.tick()
-        self.last_ticked_goal = highest_priority
+    def get_players(self) -> list["Player"]:
+        return [player for player in self.game.players if player.room is self.room]
 
     def attack(self):
-        players = list(filter(lambda p: self.sees_other(p), self.game.players))
+        players = self.room.line_of_sight.get_visible(self, self.get_players())
         player_count = len(players)
 
         if player_count == 0:
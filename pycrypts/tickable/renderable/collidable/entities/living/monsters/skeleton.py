@@ -1,7 +1,5 @@
 from typing import TYPE_CHECKING
 
-import pygame
-
 from .ai.goals.back_off_from_target import BackOffFromTargetGoal
 from .ai.goals.random_wander import RandomWanderGoal
 from .ai.goals.walk_to_target import WalkToTargetGoal
@@ -24,12 +22,12 @@ class Skeleton(Monster):
         super().__init__(position, "skeleton", size, 50, game, room)
 
     def register_goals(self):
-        self.goals.append(RandomWanderGoal(self, 2, self.game, 0.35, Skeleton.wander_duration, Skeleton.wander_cooldown, Skeleton.randomness))
-        self.goals.append(WalkToTargetGoal(self, 1, self.game, 0.6))
-        self.goals.append(BackOffFromTargetGoal(self, 0, self.game, 0.7, 200))
+        self.goals.add(RandomWanderGoal(self, 2, self.game, 0.35, Skeleton.wander_duration, Skeleton.wander_cooldown, Skeleton.randomness))
+        self.goals.add(WalkToTargetGoal(self, 1, self.game, 0.6))
+        self.goals.add(BackOffFromTargetGoal(self, 0, self.game, 0.7, 200))
 
     def attack_entity(self, entity: LivingEntity):
-        Fireball(entity.get_center(), (self.position.x, self.position.y), 32, self.game, self.room, 1.2)
+        Fireball.spawn(entity.get_center(), (self.position.x, self.position.y), 32, self.game, self.room, 1.2)
 
     def is_colliding(self, entity: Entity) -> bool:
         if isinstance(entity, Fireball):
@@ -40,11 +38,9 @@ class Skeleton(Monster):
     def damage(self, damage):
         super().damage(damage)
 
-        sound = self.game.get_sound("assets/sounds/skeleton_damage")
-        pygame.mixer.Sound.play(sound)
+        self.game.play_sound("assets/sounds/skeleton_damage")
 
     def die(self):
         super().die()
 
-        sound = self.game.get_sound("assets/sounds/skeleton_death")
-        pygame.mixer.Sound.play(sound)
+        self.game.play_sound("assets/sounds/skeleton_death")
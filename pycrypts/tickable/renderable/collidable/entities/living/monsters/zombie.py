@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING
 
-import pygame
 from pygame import Vector2
 
 from .ai.goals.random_wander import RandomWanderGoal
@@ -27,8 +26,8 @@ class Zombie(Monster):
         self.wandering = False
 
     def register_goals(self):
-        self.goals.append(RandomWanderGoal(self, 1, self.game, 0.35, Zombie.wander_duration, Zombie.wander_cooldown, Zombie.randomness))
-        self.goals.append(StrafeToTargetGoal(self, 0, self.game, 0.65))
+        self.goals.add(RandomWanderGoal(self, 1, self.game, 0.35, Zombie.wander_duration, Zombie.wander_cooldown, Zombie.randomness))
+        self.goals.add(StrafeToTargetGoal(self, 0, self.game, 0.65))
 
     def attack_entity(self, entity: "LivingEntity"):
         if self.position.distance_squared_to(entity.position) < (10000 * self.game.current_room.entity_scale * self.game.current_room.entity_scale):
@@ -38,11 +37,9 @@ class Zombie(Monster):
     def damage(self, damage):
         super().damage(damage)
 
-        sound = self.game.get_sound('assets/sounds/zombie_damage')
-        pygame.mixer.Sound.play(sound)
+        self.game.play_sound('assets/sounds/zombie_damage')
 
     def die(self):
         super().die()
 
-        sound = self.game.get_sound('assets/sounds/zombie_death')
-        pygame.mixer.Sound.play(sound)
+        self.game.play_sound('assets/sounds/zombie_death')
@@ -34,7 +34,9 @@ class Player(LivingEntity):
 
     def unload(self):
         super().unload()
-        self.game.players.remove(self)
+
+        if self in self.game.players:
+            self.game.players.remove(self)
 
     def tick(self):
         super().tick()
@@ -42,7 +44,7 @@ class Player(LivingEntity):
         self.time_since_last_attack += self.game.dt
         self.time_since_last_regeneration += self.game.dt
 
-        keys = pygame.key.get_pressed()
+        keys = self.game.keys
         if keys[self.attack_key]:
             self.attack()
 
@@ -57,7 +59,7 @@ class Player(LivingEntity):
     def move(self):
         super().move()
 
-        keys = pygame.key.get_pressed()
+        keys = self.game.keys
 
         distance_travelled = pygame.Vector2()
 
@@ -84,7 +86,8 @@ class Player(LivingEntity):
         if self.time_since_last_attack < Player.attack_cooldown:
             return
 
-        attackable_entities: list[LivingEntity] = list(filter(lambda e: not isinstance(e, Player) and self.sees_other(e), self.room.get_living_entities()))
+        candidates = [e for e in self.room.get_living_entities() if not isinstance(e, Player)]
+        attackable_entities: list[LivingEntity] = self.room.line_of_sight.get_visible(self, candidates)
 
         if len(attackable_entities) == 0:
             return
@@ -94,11 +97,11 @@ class Player(LivingEntity):
         self.attack_entity(closest_entity)
 
     def sword_attack(self, entity: LivingEntity):
-        Sword(entity, self, self.get_center(), self.game, self.room)
+        Sword.spawn(entity, self, self.get_center(), self.game, self.room)
         pass
 
     def bow_attack(self, entity: LivingEntity):
-        Arrow(entity.get_center(), self.get_center(), 32, self.game, self.room)
+        Arrow.spawn(entity.get_center(), self.get_center(), 32, self.game, self.room)
         pass
 
     def attack_entity(self, entity: LivingEntity):
@@ -112,9 +115,7 @@ class Player(LivingEntity):
     def damage(self, damage: int):
         super().damage(damage)
 
-        sound = pygame.mixer.Sound('assets/sounds/damage.mp3')
-        sound.set_volume(0.125)
-        pygame.mixer.Sound.play(sound)
+        self.game.play_sound('assets/sounds/damage')
 
     def die(self):
         super().die()
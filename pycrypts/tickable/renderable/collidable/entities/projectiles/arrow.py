@@ -1,7 +1,6 @@
 import math
 from typing import TYPE_CHECKING
 
-import pygame
 from pygame import Vector2
 
 from .fireball import Fireball
@@ -18,8 +17,23 @@ class Arrow(Fireball):
     def __init__(self, target: Vector2, position: Vector2, size: int, game: "PyCrypts", room: "Room"):
         super().__init__(target, position, size, game, room, 2, "arrow")
 
+    @classmethod
+    def spawn(cls, target: Vector2, position: Vector2, size: int, game: "PyCrypts", room: "Room") -> "Arrow":
+        arrow = game.entity_pool.acquire(cls)
+
+        if arrow is None:
+            return cls(target, position, size, game, room)
+
+        arrow.reset(target, position, size, room, 2)
+        arrow.load()
+
+        return arrow
+
+    def launch(self, target: Vector2, position: Vector2, speed):
+        super().launch(target, position, speed)
+
         angle = math.atan2(self.target.y - self.position.y, self.target.x - self.position.x)
-        self.image = pygame.transform.rotate(self.image, -math.degrees(angle) - 45)
+        self.image = self.game.transforms.get(self.asset, self.size, -math.degrees(angle) - 45)
         self.hit = False
 
     def is_colliding(self, entity: Collidable) -> bool:
@@ -1,10 +1,10 @@
-import random
 from typing import TYPE_CHECKING
 
 from pygame import Vector2
 
 from ..entity import Entity
 from ..living.living_entity import LivingEntity
+from ......enums.render_layer import RenderLayer
 
 if TYPE_CHECKING:
     from ......game import PyCrypts
@@ -12,13 +12,36 @@ if TYPE_CHECKING:
 
 
 class Fireball(Entity):
+    layer = RenderLayer.PROJECTILES
+    poolable = True
+    swept = True
 
     def __init__(self, target: Vector2, position: Vector2, size: int, game: "PyCrypts", room: "Room", speed=1, character="fireball"):
         super().__init__(position, character, size, game, room)
+        self.launch(target, position, speed)
+
+    @classmethod
+    def spawn(cls, target: Vector2, position: Vector2, size: int, game: "PyCrypts", room: "Room", speed=1) -> "Fireball":
+        fireball = game.entity_pool.acquire(cls)
+
+        if fireball is None:
+            return cls(target, position, size, game, room, speed)
+
+        fireball.reset(target, position, size, room, speed)
+        fireball.load()
+
+        return fireball
+
+    def reset(self, target: Vector2, position: Vector2, size: int, room: "Room", speed=1):
+        self.absolute_size = size
+        super().reset(position, room)
+        self.launch(target, position, speed)
+
+    def launch(self, target: Vector2, position: Vector2, speed):
         self.target = Vector2(target)
         self.direction = target - position
         self.speed = speed
-        self.strong = random.randint(0, 1) == 0
+        self.strong = self.random.randint(0, 1) == 0
 
     def move(self):
         self.move_without_collision(self.direction, self.speed)
@@ -1,7 +1,6 @@
 import math
 from typing import TYPE_CHECKING
 
-import pygame
 from pygame import Vector2
 
 from .arrow import Arrow
@@ -9,6 +8,7 @@ from .fireball import Fireball
 from ..entity import Entity
 from ..living.living_entity import LivingEntity
 from ...collidable import Collidable
+from ......enums.render_layer import RenderLayer
 
 if TYPE_CHECKING:
     from ......game import PyCrypts
@@ -17,10 +17,27 @@ if TYPE_CHECKING:
 
 
 class Sword(Entity):
+    layer = RenderLayer.PROJECTILES
+    poolable = True
 
     def __init__(self, target, user: "Player", position: tuple[int, int] | Vector2, game: "PyCrypts", room: "Room"):
         super().__init__(position, "sword", 64, game, room)
+        self.swing(target, user)
 
+    @classmethod
+    def spawn(cls, target, user: "Player", position: tuple[int, int] | Vector2, game: "PyCrypts", room: "Room") -> "Sword":
+        sword = game.entity_pool.acquire(cls)
+
+        if sword is None:
+            return cls(target, user, position, game, room)
+
+        sword.reset(position, room)
+        sword.swing(target, user)
+        sword.load()
+
+        return sword
+
+    def swing(self, target, user: "Player"):
         self.target = target
         self.user = user
         self.time_left = 0.5
@@ -28,7 +45,7 @@ class Sword(Entity):
 
     def tick(self):
         super().tick()
-        self.time_left -= self.game.dt
+        self.time_left -= self.game.dt * self.step_scale
 
         if self.time_left <= 0:
             self.unload()
@@ -41,10 +58,7 @@ class Sword(Entity):
         offset = offset.normalize() * (self.user.size / 2)
         offset.y = math.copysign(1, y) * (self.user.size / 4)
 
-        if offset.x < 0:
-            self.image = pygame.transform.flip(self.base_image, True, False)
-        else:
-            self.image = self.base_image
+        self.image = self.game.transforms.get(self.asset, self.size, flipped=offset.x < 0)
 
         self.position = self.user.position + offset
 
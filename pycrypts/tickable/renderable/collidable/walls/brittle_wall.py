@@ -1,7 +1,5 @@
 from typing import TYPE_CHECKING
 
-import pygame
-
 from .wall import Wall
 from ..entities.living.monsters.monster import Monster
 
@@ -25,13 +23,11 @@ class BrittleWall(Wall):
         return super().tick()
 
     def is_broken(self):
-        return all(map(lambda monster: not monster in self.game.tickables, self.monsters_to_defeat))
+        return all(map(lambda monster: monster not in self.game.registry, self.monsters_to_defeat))
 
     def set_broken(self):
         self.broken = True
 
-        sound = pygame.mixer.Sound('assets/sounds/explosion.mp3')
-        sound.set_volume(0.125)
-        pygame.mixer.Sound.play(sound)
+        self.game.play_sound('assets/sounds/explosion')
 
         self.unload()
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
 
 
 class Door(Wall):
+    # Doors light up while someone stands in them, so they can't be baked into the background.
+    static = False
+    solid = False
+
     def __init__(self, top_left: [int, int], bottom_right: tuple[int, int], destination: "Room", spawns: (Vector2, Vector2), game: "PyCrypts", room: "Room"):
         self.destination = destination
         self.__spawns = spawns
@@ -35,9 +39,9 @@ class Door(Wall):
         if in_door:
             transparent_surface = pygame.Surface((width, height), pygame.SRCALPHA)
             transparent_surface.fill((140, 65, 5, 224))
-            self.game.screen.blit(transparent_surface, self.top_left)
+            self.game.renderer.blit(self.layer, transparent_surface, self.top_left)
         else:
-            pygame.draw.rect(self.game.screen, (140, 65, 5), Rect(self.top_left, (width, height)))
+            self.game.renderer.fill(self.layer, (140, 65, 5), Rect(self.top_left, (width, height)))
 
     def on_players_enter(self):
         if self.destination is not None:
@@ -47,9 +51,9 @@ class Door(Wall):
             for player in players:
                 i += 1
                 if i == 1:
-                    player.position = Vector2(self.get_spawns()[0])
+                    player.teleport(self.get_spawns()[0])
                 else:
-                    player.position = Vector2(self.get_spawns()[1])
+                    player.teleport(self.get_spawns()[1])
 
                 player.set_scale(self.destination.entity_scale)
 
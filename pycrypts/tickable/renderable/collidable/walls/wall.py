@@ -1,18 +1,26 @@
 from typing import TYPE_CHECKING
 
 import pygame
-from pygame import Vector2, Rect
+from pygame import Vector2, Rect, Surface
 
 from ..collidable import Collidable
 from ..entities.entity import Entity
 from ....tickable import Tickable
+from .....enums.render_layer import RenderLayer
 
 if TYPE_CHECKING:
     from .....game import PyCrypts
+    from .....physics.spatial_hash import Bounds
     from .....rooms.room import Room
 
 
 class Wall(Collidable):
+    static = True
+    layer = RenderLayer.WALLS
+
+    # Solid walls block entities purely by their rectangle, which lets navigation, sweeps and room workers use just the bounds.
+    solid = True
+
     points: list[  # list of
         tuple[  # pair of
             tuple[int, int],  # top left 
@@ -26,6 +34,11 @@ class Wall(Collidable):
         self.bottom_right = Vector2(bottom_right)
         self.game = game
 
+        self.update_broadphase()
+
+    def get_bounds(self) -> "Bounds":
+        return self.top_left.x, self.top_left.y, self.bottom_right.x, self.bottom_right.y
+
     def get_center(self):
         return (self.top_left + self.bottom_right) / 2.0
 
@@ -43,26 +56,32 @@ class Wall(Collidable):
             (Vector2(self.top_left.x, self.bottom_right.y), self.bottom_right)
         ]
 
-    def tick(self):
-        self.render()
-
     def render(self):
+        self.game.renderer.fill(self.layer, (65, 65, 65), Rect(self.top_left, (self.get_width(), self.get_height())))
+
+    def draw(self, surface: Surface) -> Rect:
         width = self.bottom_right.x - self.top_left.x
         height = self.bottom_right.y - self.top_left.y
 
-        pygame.draw.rect(self.game.screen, (65, 65, 65), Rect(self.top_left, (width, height)))
-        pass
+        return pygame.draw.rect(surface, (65, 65, 65), Rect(self.top_left, (width, height)))
 
     def is_colliding(self, other: Collidable) -> bool:
         if isinstance(other, Entity):
             if other.no_clip:
                 return False
 
-            points = other.get_points()
+            # A corner of the entity's box is inside the wall when a left or right edge and a top or bottom
+            # edge both fall within its span. Tested on the coordinates, without building the corners.
+            x, y = other.position
+            far_x = x + other.size
+            far_y = y + other.size
+
+            left = self.top_left.x
+            top = self.top_left.y
+            right = self.bottom_right.x
+            bottom = self.bottom_right.y
 
-            for point in points:
-                if self.contains_point(point):
-                    return True
+            return (left <= x <= right or left <= far_x <= right) and (top <= y <= bottom or top <= far_y <= bottom)
         return False
 
     def contains_point(self, point: Vector2) -> bool:
@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING
 
-import pygame
 from pygame import Vector2
 
 from .text import Text
@@ -25,18 +24,17 @@ class HealthBar(Renderable):
 
         self.top_left = Vector2(top_left)
 
-        self.text = Text(str(entity.health), (self.top_left.x + 5, self.top_left.y), (160, 0, 0), game, 35)
-
-    def tick(self):
-        self.render()
+        self.health = entity.health
+        self.text = Text(str(entity.health), (self.top_left.x + 5, self.top_left.y), (160, 0, 0), game, 35, glyphs=True)
 
     def render(self):
-        self.text.text = str(self.entity.health)
-
-        pygame.draw.rect(self.game.screen, (115, 115, 115), (self.top_left.x - 5, self.top_left.y - 5, self.width + 10, self.height + 10))
-        pygame.draw.rect(self.game.screen, (200, 50, 50), (self.top_left.x, self.top_left.y, self.width * (self.entity.health / self.entity.max_health), self.height))
+        # The text renders itself as a renderable of its own, on top of the bar since fills go under blits.
+        if self.entity.health != self.health:
+            self.health = self.entity.health
+            self.text.text = str(self.health)
 
-        self.text.render()
+        self.game.renderer.fill(self.layer, (115, 115, 115), (self.top_left.x - 5, self.top_left.y - 5, self.width + 10, self.height + 10))
+        self.game.renderer.fill(self.layer, (200, 50, 50), (self.top_left.x, self.top_left.y, self.width * (self.entity.health / self.entity.max_health), self.height))
 
     def unload(self):
         self.text.unload()
@@ -0,0 +1,46 @@
+from typing import TYPE_CHECKING
+
+from pygame import Vector2
+
+from .text import Text
+from ..renderable import Renderable
+
+if TYPE_CHECKING:
+    from ....game import PyCrypts
+    from ....profiling.frame_profiler import FrameProfiler
+
+
+class ProfilerOverlay(Renderable):
+    lines = 12
+    line_height = 18
+
+    # Frames between refreshes, so the numbers can be read.
+    refresh_interval = 15
+
+    def __init__(self, profiler: "FrameProfiler", top_left: tuple[int, int] | Vector2, game: "PyCrypts"):
+        super().__init__(game)
+
+        self.profiler = profiler
+        self.top_left = Vector2(top_left)
+
+        self.texts = [
+            Text("", (self.top_left.x + 5, self.top_left.y + 5 + line * self.line_height), (230, 230, 230), game, 16)
+            for line in range(self.lines)
+        ]
+
+        self.texts[0].text = "Profiler (ms per frame, inclusive)"
+
+    def render(self):
+        if self.profiler.frames % self.refresh_interval == 0:
+            stats = list(self.profiler.get_stats().items())
+
+            for line, text in enumerate(self.texts[1:]):
+                text.text = f"{stats[line][0]}: {stats[line][1]:.2f}" if line < len(stats) else ""
+
+        self.game.renderer.fill(self.layer, (20, 20, 20), (self.top_left.x, self.top_left.y, 280, self.lines * self.line_height + 10))
+
+    def unload(self):
+        for text in self.texts:
+            text.unload()
+
+        super().unload()
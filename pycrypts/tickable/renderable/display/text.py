@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 import pygame
-from pygame import Vector2
+from pygame import Surface, Vector2
 
 from ..renderable import Renderable
 
@@ -10,7 +10,9 @@ if TYPE_CHECKING:
 
 
 class Text(Renderable):
-    def __init__(self, text, location, color, game: "PyCrypts", size=20):
+    font_name = "Arial"
+
+    def __init__(self, text, location, color, game: "PyCrypts", size=20, glyphs=False):
         super().__init__(game)
 
         self.text = text
@@ -18,22 +20,32 @@ class Text(Renderable):
 
         self.location = Vector2(location)
 
-        self.font = pygame.font.SysFont('Arial', size)
+        self.size = size
+        self.font = game.text_cache.get_font(Text.font_name, size)
 
-        self.game = game
+        # Text that changes often, such as numbers, can be drawn glyph by glyph from an atlas instead.
+        self.glyphs = game.text_cache.get_glyphs(Text.font_name, size, color) if glyphs else None
 
-    def tick(self):
-        self.render()
-        pass
+        self.game = game
 
     def render(self):
-        img = self.font.render(self.text, True, self.color)
-        self.game.screen.blit(img, self.location)
-        pass
+        if self.glyphs is not None and all(character in self.glyphs for character in self.text):
+            x = self.location.x
+
+            for character in self.text:
+                glyph = self.glyphs[character]
+                self.game.renderer.blit(self.layer, glyph, (x, self.location.y))
+                x += glyph.get_width()
+
+            return
+
+        self.game.renderer.blit(self.layer, self.get_surface(), self.location)
+
+    def get_surface(self) -> Surface:
+        return self.game.text_cache.render(self.text, Text.font_name, self.size, self.color)
 
     def clear(self):
-        img = self.font.render(self.text, True, self.color)
-        rect = img.get_rect(topleft=self.location)
+        rect = self.get_surface().get_rect(topleft=self.location)
         pygame.draw.rect(self.game.screen, (0, 0, 0), rect)
         pass
 
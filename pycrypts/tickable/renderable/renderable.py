@@ -1,11 +1,15 @@
 from typing import TYPE_CHECKING
 
 from ..tickable import Tickable
+from ...enums.render_layer import RenderLayer
 
 if TYPE_CHECKING:
     from ...game import PyCrypts
 
 class Renderable(Tickable):
+    # Static renderables are baked into their room's background instead of being drawn every frame.
+    static = False
+    layer = RenderLayer.HUD
 
     def __init__(self, game: "PyCrypts"):
         super().__init__(game)
@@ -14,12 +14,14 @@ class Tickable:
 
     def load(self):
         self.game.logger.debug(f"Loading tickable {type(self).__name__}")
-        self.game.tickables.append(self)
+        self.game.tickables.add(self)
+        self.game.registry.add(self)
 
     def unload(self):
         self.game.logger.debug(f"Unloading tickable {type(self).__name__}")
-        if self in self.game.tickables:
+        if self in self.game.registry:
             self.game.logger.debug(f"Successfully unloaded tickable {type(self).__name__}")
             self.game.tickables.remove(self)
+            self.game.registry.remove(self)
         else:
             self.game.logger.warning(f"Failed to unload tickable {type(self).__name__}")
@@ -0,0 +1,70 @@
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from .tickable import Tickable
+
+
+class TickableContainer:
+    def __init__(self):
+        self.items: dict["Tickable", None] = {}
+
+        # Changes made while the container is being iterated are queued and applied once iteration ends.
+        self.spawning: dict["Tickable", None] = {}
+        self.despawning: dict["Tickable", None] = {}
+
+        self.iterating = 0
+
+    def __contains__(self, tickable: "Tickable") -> bool:
+        if tickable in self.spawning:
+            return True
+
+        return tickable in self.items and tickable not in self.despawning
+
+    def __len__(self):
+        return len(self.items) + len(self.spawning) - len(self.despawning)
+
+    def __iter__(self) -> Iterator["Tickable"]:
+        self.iterating += 1
+
+        try:
+            despawning = self.despawning
+
+            for tickable in self.items:
+                if tickable not in despawning:
+                    yield tickable
+        finally:
+            self.iterating -= 1
+
+            if self.iterating == 0:
+                self.flush()
+
+    def add(self, tickable: "Tickable"):
+        if not self.iterating:
+            self.items[tickable] = None
+            return
+
+        # Something re-added while queued for removal, such as a pooled projectile reacquired the step it was
+        # released, stays skipped for the rest of this pass and rejoins at the end like anything newly spawned.
+        if tickable not in self.items or tickable in self.despawning:
+            self.spawning[tickable] = None
+
+    def remove(self, tickable: "Tickable"):
+        if not self.iterating:
+            del self.items[tickable]
+            return
+
+        if tickable in self.spawning:
+            del self.spawning[tickable]
+        elif tickable in self.items:
+            self.despawning[tickable] = None
+
+    def flush(self):
+        if self.despawning:
+            for tickable in self.despawning:
+                del self.items[tickable]
+
+            self.despawning.clear()
+
+        if self.spawning:
+            self.items.update(self.spawning)
+            self.spawning.clear()
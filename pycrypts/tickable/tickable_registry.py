@@ -0,0 +1,114 @@
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from ..rooms.room import Room
+    from .tickable import Tickable
+
+T = TypeVar("T")
+
+
+class TickableRegistry:
+    def __init__(self):
+        # Buckets are keyed by (room, class). A room of None holds tickables from every room.
+        self.buckets: dict[tuple["Room | None", type], dict["Tickable", None]] = {}
+        self.views: dict[tuple["Room | None", type], tuple] = {}
+
+        # Bumped whenever a bucket gains or loses a tickable. Caches built from a bucket, such as everything baked from
+        # a room's walls, keep the version they were built at and only rebuild once it moves on.
+        self.versions: dict[tuple["Room | None", type], int] = {}
+
+        self.rooms: dict["Tickable", "Room | None"] = {}
+        self.types: dict[type, tuple[type, ...]] = {}
+
+    def __contains__(self, tickable: "Tickable") -> bool:
+        return tickable in self.rooms
+
+    def __len__(self):
+        return len(self.rooms)
+
+    def add(self, tickable: "Tickable"):
+        if tickable in self.rooms:
+            return
+
+        room = getattr(tickable, "room", None)
+        self.rooms[tickable] = room
+
+        for cls in self.get_types(type(tickable)):
+            self.insert((None, cls), tickable)
+
+            if room is not None:
+                self.insert((room, cls), tickable)
+
+    def remove(self, tickable: "Tickable"):
+        if tickable not in self.rooms:
+            return
+
+        room = self.rooms.pop(tickable)
+
+        for cls in self.get_types(type(tickable)):
+            self.delete((None, cls), tickable)
+
+            if room is not None:
+                self.delete((room, cls), tickable)
+
+    def move(self, tickable: "Tickable", room: "Room | None"):
+        if tickable not in self.rooms:
+            return
+
+        previous = self.rooms[tickable]
+
+        if previous is room:
+            return
+
+        self.rooms[tickable] = room
+
+        for cls in self.get_types(type(tickable)):
+            if previous is not None:
+                self.delete((previous, cls), tickable)
+
+            if room is not None:
+                self.insert((room, cls), tickable)
+
+    def get(self, cls: type[T], room: "Room | None" = None) -> tuple[T, ...]:
+        key = (room, cls)
+
+        view = self.views.get(key)
+
+        if view is None:
+            view = tuple(self.buckets.get(key, ()))
+            self.views[key] = view
+
+        return view
+
+    def get_version(self, cls: type, room: "Room | None" = None) -> int:
+        return self.versions.get((room, cls), 0)
+
+    def get_types(self, cls: type) -> tuple[type, ...]:
+        types = self.types.get(cls)
+
+        if types is None:
+            from .tickable import Tickable
+            types = tuple(base for base in cls.__mro__ if issubclass(base, Tickable))
+            self.types[cls] = types
+
+        return types
+
+    def insert(self, key: tuple["Room | None", type], tickable: "Tickable"):
+        bucket = self.buckets.get(key)
+
+        if bucket is None:
+            bucket = self.buckets[key] = {}
+
+        bucket[tickable] = None
+        self.views.pop(key, None)
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def delete(self, key: tuple["Room | None", type], tickable: "Tickable"):
+        bucket = self.buckets.get(key)
+
+        if bucket is None or tickable not in bucket:
+            return
+
+        del bucket[tickable]
+        self.views.pop(key, None)
+        self.versions[key] = self.versions.get(key, 0) + 1